@@ -7,23 +7,106 @@ This module provides the HTTP API for:
 - Stream visualization
 """
 
-from fastapi import FastAPI, HTTPException, Body
+from fastapi import FastAPI, HTTPException, Body, Request
 from fastapi.middleware.cors import CORSMiddleware
-from typing import Any, Dict, List, Optional
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import Response, StreamingResponse
+from typing import Any, Dict, List, Literal, Optional, Tuple
 from pathlib import Path
+from functools import lru_cache
+from contextlib import asynccontextmanager
+from stat import S_ISREG
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+import asyncio
+import multiprocessing
 import os
-
+import pickle
+
+import msgspec
+import orjson
+
+try:
+    from brotli_asgi import BrotliMiddleware
+except ImportError:
+    # Brotli is optional; fall back to gzip-only compression
+    BrotliMiddleware = None
+
+from app_meshed.api.responses import (
+    ORJSON_OPTIONS,
+    NumpyORJSONResponse,
+    wants_binary,
+    array_response,
+    multi_array_response,
+    iter_json_mapping,
+)
+from app_meshed.models.requests import (
+    DagExecuteRequest,
+    MultiChannelSliceRequest,
+    json_body_schema,
+)
 from app_meshed.stores.root_store import create_default_root_store
 from app_meshed.services.function_registry import get_global_registry
-from app_meshed.services.schema_service import func_to_schema, object_to_schema, get_dag_config_schema
-from app_meshed.services.dag_service import DAGService
+from app_meshed.services.schema_service import (
+    func_to_schema,
+    object_to_schema,
+    get_dag_config_schema_json,
+)
+from app_meshed.services.dag_service import (
+    DAGLoadError,
+    DAGService,
+    run_dag,
+    run_pickled_dag,
+    create_simple_dag_example,
+    create_chained_dag_example,
+)
 from app_meshed.services.stream_service import get_stream_registry, MultiChannelView
 
+DATA_PATH = os.getenv("APP_MESHED_DATA_PATH", "./data")
+
+# DAG execution runs off the event loop: in worker processes (so CPU-bound
+# DAGs run in parallel, outside the GIL), or in threads for DAGs that can't
+# be pickled (e.g. built from locally defined functions). The CPUs are shared
+# between the server's worker processes (see cli.py), each having its own pool.
+_SERVER_WORKERS = max(1, int(os.getenv("APP_MESHED_SERVER_WORKERS", "1")))
+DAG_POOL_SIZE = max(1, (os.cpu_count() or 1) // _SERVER_WORKERS)
+
+
+def _new_dag_process_pool() -> ProcessPoolExecutor:
+    return ProcessPoolExecutor(
+        max_workers=DAG_POOL_SIZE, mp_context=multiprocessing.get_context("spawn")
+    )
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Run initialization tasks on server startup.
+
+    Initialization writes sample data files, so it runs in a worker thread
+    to keep the event loop responsive. The DAG execution pools live for the
+    duration of the app (on ``app.state``), so each startup gets fresh ones.
+    """
+    from app_meshed.api.startup import run_startup_initialization
+
+    await asyncio.to_thread(run_startup_initialization, data_path=DATA_PATH)
+    # Sample data files are written directly, not through the store
+    root_store.invalidate()
+    app.state.dag_process_pool = _new_dag_process_pool()
+    app.state.dag_thread_pool = ThreadPoolExecutor()
+    try:
+        yield
+    finally:
+        app.state.dag_process_pool.shutdown(cancel_futures=True)
+        app.state.dag_thread_pool.shutdown(cancel_futures=True)
+
+
 # Create FastAPI app
 app = FastAPI(
     title="app_meshed",
     description="HTTP services for meshed operations",
     version="0.0.1",
+    default_response_class=NumpyORJSONResponse,
+    lifespan=lifespan,
 )
 
 # Configure CORS for frontend access
@@ -35,9 +118,27 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress large response bodies (stream slices, stats); small ones are sent as-is
+COMPRESSION_MINIMUM_SIZE = 1024
+if BrotliMiddleware is not None:
+    app.add_middleware(
+        BrotliMiddleware,
+        quality=4,
+        minimum_size=COMPRESSION_MINIMUM_SIZE,
+        gzip_fallback=True,
+    )
+else:
+    app.add_middleware(
+        GZipMiddleware, minimum_size=COMPRESSION_MINIMUM_SIZE, compresslevel=4
+    )
+
 # Initialize stores
-DATA_PATH = os.getenv("APP_MESHED_DATA_PATH", "./data")
 root_store = create_default_root_store(base_path=DATA_PATH)
+_RAW_DATA_DIR = os.path.abspath(Path(DATA_PATH) / "raw_data")
+_STORES: Dict[str, Any] = {
+    name: root_store.get_store(name)
+    for name in ("raw_data", "functions", "meshes", "configs")
+}
 
 # Get function registry
 function_registry = get_global_registry()
@@ -50,12 +151,36 @@ stream_registry = get_stream_registry()
 multi_channel_view = MultiChannelView(stream_registry)
 
 
-# Startup event handler
-@app.on_event("startup")
-async def startup_event():
-    """Run initialization tasks on server startup."""
-    from app_meshed.api.startup import run_startup_initialization
-    run_startup_initialization(data_path=DATA_PATH)
+async def _decode_body(request: Request, body_type: Any) -> Any:
+    """Decode and validate a JSON request body with msgspec (bypassing pydantic).
+
+    Raises:
+        HTTPException: 422 if the body is malformed or doesn't match body_type
+    """
+    try:
+        return msgspec.json.decode(await request.body(), type=body_type)
+    except msgspec.DecodeError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+
+
+def _body_docs(body_type: Any) -> Dict:
+    """OpenAPI request body documentation for a msgspec-decoded endpoint."""
+    schema = json_body_schema(body_type)
+    return {
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": schema}},
+        }
+    }
+
+
+# Schemas are pure functions of the registered callables: cache them, already
+# JSON-encoded, keyed on the registry version so (re)registrations are picked up
+@lru_cache(maxsize=512)
+def _function_schema_bytes(function_name: str, registry_version: int) -> bytes:
+    func = function_registry.get_function(function_name)
+    schema = func_to_schema(func, title=f"{function_name} Parameters")
+    return orjson.dumps(schema, option=ORJSON_OPTIONS)
 
 
 @app.get("/")
@@ -82,20 +207,42 @@ async def health():
 # ============================================================================
 # Store API Endpoints
 # ============================================================================
+# Store operations hit the disk, so they run in worker threads
+# (asyncio.to_thread) instead of blocking the event loop.
+
+
+def _get_store(store_name: str):
+    """Get a sub-store by name from the pre-resolved store handles.
+
+    Raises:
+        HTTPException: 404 if there's no store with that name
+    """
+    store = _STORES.get(store_name)
+    if store is None:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Unknown store: {store_name}. "
+            f"Available stores: {', '.join(_STORES)}",
+        )
+    return store
+
+
+_STORE_LIST_RESPONSE = {
+    "stores": ["raw_data", "functions", "meshes", "configs"],
+    "description": {
+        "raw_data": "Binary blobs (audio, sensor data)",
+        "functions": "Callable functions for DAG composition",
+        "meshes": "Saved DAG configurations",
+        "configs": "Application configurations",
+    },
+}
+_STORE_LIST_BYTES = orjson.dumps(_STORE_LIST_RESPONSE)
 
 
 @app.get("/store/list")
 async def list_stores():
     """List all available stores."""
-    return {
-        "stores": ["raw_data", "functions", "meshes", "configs"],
-        "description": {
-            "raw_data": "Binary blobs (audio, sensor data)",
-            "functions": "Callable functions for DAG composition",
-            "meshes": "Saved DAG configurations",
-            "configs": "Application configurations",
-        },
-    }
+    return Response(content=_STORE_LIST_BYTES, media_type="application/json")
 
 
 @app.get("/store/{store_name}/keys")
@@ -108,12 +255,10 @@ async def list_store_keys(store_name: str):
     Returns:
         List of keys in the store
     """
+    store = _get_store(store_name)
     try:
-        store = root_store.get_store(store_name)
-        keys = list(store.keys())
+        keys = await asyncio.to_thread(lambda: list(store.keys()))
         return {"store": store_name, "keys": keys, "count": len(keys)}
-    except ValueError as e:
-        raise HTTPException(status_code=404, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error listing keys: {str(e)}")
 
@@ -129,30 +274,40 @@ async def get_store_item(store_name: str, key: str):
     Returns:
         The requested item
     """
+    store = _get_store(store_name)
     try:
-        store = root_store.get_store(store_name)
-
-        if key not in store:
-            raise HTTPException(
-                status_code=404, detail=f"Key '{key}' not found in store '{store_name}'"
-            )
-
-        item = store[key]
+        not_found = HTTPException(
+            status_code=404, detail=f"Key '{key}' not found in store '{store_name}'"
+        )
 
-        # For raw_data, return metadata instead of binary content
+        # For raw_data, return metadata instead of binary content (so the
+        # blob itself is never read)
         if store_name == "raw_data":
-            file_path = Path(DATA_PATH) / store_name / key
+            # Keys must name a file inside the raw_data directory (no absolute
+            # paths or ".." escapes)
+            file_path = os.path.normpath(os.path.join(_RAW_DATA_DIR, key))
+            if not file_path.startswith(_RAW_DATA_DIR + os.sep):
+                raise not_found
+            try:
+                stat = await asyncio.to_thread(os.stat, file_path)
+            except (FileNotFoundError, NotADirectoryError):
+                raise not_found
+            if not S_ISREG(stat.st_mode):
+                raise not_found
             return {
                 "key": key,
-                "size": file_path.stat().st_size,
+                "size": stat.st_size,
                 "type": "binary",
-                "path": str(file_path),
+                "path": str(Path(DATA_PATH) / store_name / key),
             }
 
+        try:
+            item = await asyncio.to_thread(store.__getitem__, key)
+        except KeyError:
+            raise not_found
+
         return {"key": key, "value": item}
 
-    except ValueError as e:
-        raise HTTPException(status_code=404, detail=str(e))
     except HTTPException:
         raise
     except Exception as e:
@@ -171,9 +326,8 @@ async def put_store_item(store_name: str, key: str, value: Any = Body(...)):
     Returns:
         Confirmation message
     """
+    store = _get_store(store_name)
     try:
-        store = root_store.get_store(store_name)
-
         # Don't allow storing to raw_data via this endpoint (use file upload instead)
         if store_name == "raw_data":
             raise HTTPException(
@@ -181,11 +335,9 @@ async def put_store_item(store_name: str, key: str, value: Any = Body(...)):
                 detail="Use /upload endpoint for raw_data files",
             )
 
-        store[key] = value
+        await asyncio.to_thread(store.__setitem__, key, value)
         return {"status": "success", "store": store_name, "key": key}
 
-    except ValueError as e:
-        raise HTTPException(status_code=404, detail=str(e))
     except HTTPException:
         raise
     except Exception as e:
@@ -203,19 +355,17 @@ async def delete_store_item(store_name: str, key: str):
     Returns:
         Confirmation message
     """
+    store = _get_store(store_name)
     try:
-        store = root_store.get_store(store_name)
-
-        if key not in store:
+        try:
+            await asyncio.to_thread(store.__delitem__, key)
+        except KeyError:
             raise HTTPException(
                 status_code=404, detail=f"Key '{key}' not found in store '{store_name}'"
             )
 
-        del store[key]
         return {"status": "success", "store": store_name, "key": key, "action": "deleted"}
 
-    except ValueError as e:
-        raise HTTPException(status_code=404, detail=str(e))
     except HTTPException:
         raise
     except Exception as e:
@@ -235,10 +385,10 @@ async def list_functions():
         List of function names and their metadata
     """
     try:
-        return {
-            "functions": function_registry.list_functions(),
-            "metadata": function_registry.get_all_metadata(),
-        }
+        return Response(
+            content=function_registry.get_listing_bytes(),
+            media_type="application/json",
+        )
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error listing functions: {str(e)}")
 
@@ -269,6 +419,22 @@ async def get_function_metadata(function_name: str):
 # ============================================================================
 
 
+@lru_cache(maxsize=1)
+def _stats_bytes(
+    store_keys: Tuple[Tuple[str, Tuple[str, ...]], ...], registry_version: int
+) -> bytes:
+    """JSON-encode /stats, cached until store keys or registered functions change."""
+    function_names = function_registry.list_functions()
+    return orjson.dumps(
+        {
+            "stores": {
+                name: {"count": len(keys), "keys": keys} for name, keys in store_keys
+            },
+            "functions": {"count": len(function_names), "names": function_names},
+        }
+    )
+
+
 @app.get("/stats")
 async def get_stats():
     """Get statistics about the application state.
@@ -277,17 +443,11 @@ async def get_stats():
         Statistics about stores and functions
     """
     try:
-        all_keys = root_store.list_all_keys()
-        return {
-            "stores": {
-                name: {"count": len(keys), "keys": keys}
-                for name, keys in all_keys.items()
-            },
-            "functions": {
-                "count": len(function_registry.list_functions()),
-                "names": function_registry.list_functions(),
-            },
-        }
+        store_keys = await asyncio.to_thread(root_store.keys_snapshot)
+        return Response(
+            content=_stats_bytes(store_keys, function_registry.version),
+            media_type="application/json",
+        )
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error retrieving stats: {str(e)}")
 
@@ -308,9 +468,10 @@ async def get_function_schema(function_name: str):
         JSON Schema for the function's parameters
     """
     try:
-        func = function_registry.get_function(function_name)
-        schema = func_to_schema(func, title=f"{function_name} Parameters")
-        return schema
+        return Response(
+            content=_function_schema_bytes(function_name, function_registry.version),
+            media_type="application/json",
+        )
     except KeyError as e:
         raise HTTPException(status_code=404, detail=str(e))
     except Exception as e:
@@ -346,7 +507,7 @@ async def get_dag_schema():
     Returns:
         JSON Schema for DAG configuration
     """
-    return get_dag_config_schema()
+    return Response(content=get_dag_config_schema_json(), media_type="application/json")
 
 
 # ============================================================================
@@ -354,36 +515,97 @@ async def get_dag_schema():
 # ============================================================================
 
 
-@app.post("/dag/execute")
-async def execute_dag(dag_config: Dict = Body(...), inputs: Dict[str, Any] = Body({})):
+async def _run_dag_in_pool(dag, inputs: Dict[str, Any]) -> Any:
+    """Run a DAG in the process pool, or in a thread if it can't be shipped.
+
+    The DAG is pickled here, before submitting, so that only DAGs that never
+    started fall back to threads: a DAG is never run twice.
+    """
+    loop = asyncio.get_running_loop()
+    state = app.state
+    try:
+        payload = pickle.dumps((dag, inputs))
+    except Exception:  # e.g. locally defined functions
+        return await loop.run_in_executor(state.dag_thread_pool, run_dag, dag, inputs)
+    try:
+        return await loop.run_in_executor(
+            state.dag_process_pool, run_pickled_dag, payload
+        )
+    except DAGLoadError:
+        # The worker couldn't import the DAG's functions (e.g. defined in the
+        # server's __main__): it didn't run, so run it here
+        pass
+    except BrokenProcessPool:
+        # A worker died (the DAG may have partly run, so it isn't retried):
+        # replace the pool so later requests aren't affected
+        state.dag_process_pool = _new_dag_process_pool()
+        raise RuntimeError("DAG worker process died") from None
+    return await loop.run_in_executor(state.dag_thread_pool, run_dag, dag, inputs)
+
+
+@app.post("/dag/execute", openapi_extra=_body_docs(DagExecuteRequest))
+async def execute_dag(request: Request):
     """Execute a DAG from JSON configuration.
 
+    The DAG runs in a worker pool, so the event loop keeps serving other
+    requests meanwhile.
+
     Args:
-        dag_config: DAG configuration (nodes, edges, params)
-        inputs: Input values for execution
+        request: Request with a DagExecuteRequest body
+            (dag_config: nodes, edges, params; inputs: input values)
 
     Returns:
         Execution result
     """
+    body = await _decode_body(request, DagExecuteRequest)
+    dag_config, inputs = body.dag_config, body.inputs
+    dag_name = dag_config.get("name", "unnamed")
     try:
-        result = dag_service.execute_from_config(dag_config, inputs)
-        return result
+        dag, dag_inputs = dag_service.compile_from_config(dag_config, inputs)
+        result = await _run_dag_in_pool(dag, dag_inputs)
     except Exception as e:
-        raise HTTPException(status_code=500, detail=f"DAG execution error: {str(e)}")
+        return {"status": "error", "error": str(e), "dag_name": dag_name}
+    return {"status": "success", "result": result, "dag_name": dag_name}
 
 
-@app.post("/dag/validate")
-async def validate_dag(dag_config: Dict = Body(...)):
+@app.post("/dag/cache/clear")
+async def clear_dag_cache():
+    """Clear the cache of compiled DAGs.
+
+    Returns:
+        Confirmation message
+    """
+    dag_service.clear_cache()
+    return {"status": "success", "action": "cleared"}
+
+
+@app.post("/dag/validate", openapi_extra=_body_docs(Dict[str, Any]))
+async def validate_dag(request: Request, deep: bool = False):
     """Validate a DAG configuration without executing it.
 
+    By default only the configuration's shape is checked (nodes, edges,
+    registered functions), which is cheap enough to run on every edit.
+    With ``deep=true``, the DAG is also built, catching wiring errors.
+
     Args:
-        dag_config: DAG configuration to validate
+        request: Request whose body is the DAG configuration to validate
+        deep: If True, also build the DAG
 
     Returns:
         Validation result
     """
+    dag_config = await _decode_body(request, Dict[str, Any])
+    errors = dag_service.fast_validate(dag_config)
+    if errors:
+        return {
+            "status": "invalid",
+            "error": "; ".join(errors),
+            "errors": errors,
+            "dag_name": dag_config.get("name", "unnamed"),
+        }
     try:
-        dag = dag_service.json_to_dag(dag_config)
+        if deep:
+            dag_service.json_to_dag(dag_config)
         return {
             "status": "valid",
             "dag_name": dag_config.get("name", "unnamed"),
@@ -397,19 +619,8 @@ async def validate_dag(dag_config: Dict = Body(...)):
         }
 
 
-@app.get("/dag/examples")
-async def get_dag_examples():
-    """Get example DAG configurations.
-
-    Returns:
-        List of example DAG configurations
-    """
-    from app_meshed.services.dag_service import (
-        create_simple_dag_example,
-        create_chained_dag_example,
-    )
-
-    return {
+_DAG_EXAMPLES_BYTES = orjson.dumps(
+    {
         "examples": [
             {
                 "name": "Simple Add",
@@ -423,6 +634,17 @@ async def get_dag_examples():
             },
         ]
     }
+)
+
+
+@app.get("/dag/examples")
+async def get_dag_examples():
+    """Get example DAG configurations.
+
+    Returns:
+        List of example DAG configurations
+    """
+    return Response(content=_DAG_EXAMPLES_BYTES, media_type="application/json")
 
 
 # ============================================================================
@@ -468,13 +690,25 @@ async def get_stream_metadata(source_id: str):
 
 
 @app.get("/streams/{source_id}/slice")
-async def slice_stream(source_id: str, bt: float = 0.0, tt: Optional[float] = None):
+async def slice_stream(
+    request: Request,
+    source_id: str,
+    bt: float = 0.0,
+    tt: Optional[float] = None,
+    format: Literal["list", "b64"] = "list",
+):
     """Slice a stream by time range [bt:tt].
 
+    Send ``Accept: application/octet-stream`` to get the samples as raw
+    little-endian float32 bytes instead of a JSON list.
+
     Args:
+        request: Incoming request (used for content negotiation)
         source_id: Stream identifier
         bt: Bottom time (start) in seconds
         tt: Top time (end) in seconds (None = end of stream)
+        format: "list" for a JSON list of samples, "b64" for base64-encoded
+            little-endian float32 bytes
 
     Returns:
         Sliced stream data
@@ -487,38 +721,74 @@ async def slice_stream(source_id: str, bt: float = 0.0, tt: Optional[float] = No
             metadata = stream.get_metadata()
             tt = metadata.get("length_seconds", 10.0)
 
-        result = stream_registry.slice_stream(source_id, bt, tt)
-        return result
+        if wants_binary(request):
+            return array_response(
+                stream[bt:tt],
+                stream.sample_rate,
+                headers={"X-Source-Id": source_id, "X-Bt": str(bt), "X-Tt": str(tt)},
+            )
+
+        # "list" is served from the numpy array: orjson encodes it as a JSON
+        # list without creating a Python float per sample
+        result = stream_registry.slice_stream(
+            source_id, bt, tt, format="raw" if format == "list" else format
+        )
+        return NumpyORJSONResponse(result)
     except KeyError as e:
         raise HTTPException(status_code=404, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error slicing stream: {str(e)}")
 
 
-@app.post("/streams/multi-channel/slice")
-async def slice_multi_channel(
-    channel_ids: List[str] = Body(...),
-    bt: float = Body(0.0),
-    tt: float = Body(10.0),
-):
+@app.post(
+    "/streams/multi-channel/slice", openapi_extra=_body_docs(MultiChannelSliceRequest)
+)
+async def slice_multi_channel(request: Request):
     """Get synchronized slices from multiple channels.
 
+    Send ``Accept: application/octet-stream`` to get the channels as raw
+    little-endian float32 bytes, concatenated in request order.
+
     Args:
-        channel_ids: List of stream/channel IDs
-        bt: Bottom time (start) in seconds
-        tt: Top time (end) in seconds
+        request: Request with a MultiChannelSliceRequest body
+            (channel_ids: stream/channel IDs; bt, tt: time range in seconds;
+            format: "list" or "b64", as for GET /streams/{source_id}/slice;
+            layout: "channels" for one object per channel, or "stacked" for
+            a single (n_channels, n_samples) "data" block with parallel
+            "channels"/"sample_rates"/"lengths" lists).
+            Its Accept header is used for content negotiation.
 
     Returns:
         Synchronized multi-channel data
     """
-    try:
-        result = multi_channel_view.get_synchronized_slice(channel_ids, bt, tt)
-        return result
-    except Exception as e:
-        raise HTTPException(
-            status_code=500, detail=f"Error slicing multi-channel data: {str(e)}"
+    body = await _decode_body(request, MultiChannelSliceRequest)
+    channel_ids, bt, tt = body.channel_ids, body.bt, body.tt
+    format = "raw" if body.format == "list" else body.format
+    if wants_binary(request):
+        try:
+            streams = {cid: stream_registry.get(cid) for cid in channel_ids}
+        except KeyError as e:
+            raise HTTPException(status_code=404, detail=str(e))
+        return multi_array_response(
+            {cid: stream[bt:tt] for cid, stream in streams.items()},
+            {cid: stream.sample_rate for cid, stream in streams.items()},
+        )
+    if body.layout == "stacked":
+        return NumpyORJSONResponse(
+            multi_channel_view.get_stacked_slice(channel_ids, bt, tt, format=format)
         )
 
+    # Stream the JSON document channel by channel so the client can start
+    # parsing before the last channel is sliced
+    return StreamingResponse(
+        iter_json_mapping(
+            {"bt": bt, "tt": tt},
+            "channels",
+            multi_channel_view.iter_channel_slices(channel_ids, bt, tt, format=format),
+        ),
+        media_type="application/json",
+    )
+
 
 @app.post("/streams/multi-channel/info")
 async def get_multi_channel_info(channel_ids: List[str] = Body(...)):
@@ -0,0 +1,150 @@
+"""Response classes for the app_meshed HTTP API.
+
+This module provides response classes used across the FastAPI routes:
+- ORJSON-backed JSON responses with native numpy support
+- Binary (application/octet-stream) responses for sample arrays
+- Incremental JSON encoding for streamed responses
+"""
+
+from typing import Any, Dict, Iterable, Iterator, Optional, Tuple
+
+import numpy as np
+from fastapi import Request
+from fastapi.responses import JSONResponse, Response
+
+try:
+    import orjson
+except ImportError:
+    raise ImportError("orjson is required. Install with: pip install orjson")
+
+
+ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+
+class NumpyORJSONResponse(JSONResponse):
+    """JSON response serialized with orjson.
+
+    orjson encodes straight to bytes in C, and with ``OPT_SERIALIZE_NUMPY``
+    numpy arrays and scalars (e.g. stream slices) are encoded natively,
+    without a ``.tolist()`` round trip.
+    """
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        """Serialize content to JSON bytes.
+
+        Args:
+            content: JSON-serializable content (numpy arrays allowed)
+
+        Returns:
+            Encoded JSON bytes
+        """
+        return orjson.dumps(content, option=ORJSON_OPTIONS)
+
+
+def iter_json_mapping(
+    head: Dict[str, Any], field: str, items: Iterable[Tuple[str, Any]]
+) -> Iterator[bytes]:
+    """Encode ``{**head, field: dict(items)}`` as JSON, one item at a time.
+
+    Each item is encoded (and can be released) before the next is pulled,
+    so the whole document never has to be materialized. By then the response
+    status has been sent, so a value that can't be encoded is replaced by
+    ``{"error": message}`` rather than cutting the document short.
+
+    Args:
+        head: Leading fields of the JSON object
+        field: Name of the field holding the streamed mapping
+        items: (key, value) pairs of the streamed mapping
+
+    Yields:
+        Chunks of JSON bytes
+    """
+    prefix = orjson.dumps(head, option=ORJSON_OPTIONS)[:-1]
+    yield prefix + (b"," if head else b"") + orjson.dumps(field) + b":{"
+    sep = b""
+    for key, value in items:
+        try:
+            value = orjson.dumps(value, option=ORJSON_OPTIONS)
+        except orjson.JSONEncodeError as e:
+            value = orjson.dumps({"error": f"Can't encode value: {e}"})
+        yield sep + orjson.dumps(key) + b":" + value
+        sep = b","
+    yield b"}}"
+
+
+OCTET_STREAM = "application/octet-stream"
+BINARY_DTYPE = "<f4"  # little-endian float32
+
+
+def wants_binary(request: Request) -> bool:
+    """Check whether the client asked for raw binary sample data.
+
+    Args:
+        request: Incoming request
+
+    Returns:
+        True if the Accept header includes application/octet-stream
+    """
+    return OCTET_STREAM in request.headers.get("accept", "")
+
+
+def array_response(
+    data: np.ndarray, sample_rate: float, headers: Optional[Dict[str, str]] = None
+) -> Response:
+    """Build a binary response holding a sample array as little-endian float32.
+
+    Args:
+        data: Sample array
+        sample_rate: Samples per second of the data
+        headers: Extra headers to send
+
+    Returns:
+        application/octet-stream response
+    """
+    data = np.asarray(data)
+    return Response(
+        content=data.astype(BINARY_DTYPE, copy=False).tobytes(),
+        media_type=OCTET_STREAM,
+        headers={
+            "X-Sample-Rate": str(sample_rate),
+            "X-Dtype": "float32",
+            "X-Shape": ",".join(map(str, data.shape)),
+            **(headers or {}),
+        },
+    )
+
+
+def multi_array_response(
+    arrays: Dict[str, np.ndarray], sample_rates: Dict[str, float]
+) -> Response:
+    """Build a binary response holding several channels back to back.
+
+    Channels are concatenated in order as little-endian float32. The
+    ``X-Channel-Ids``, ``X-Channel-Lengths`` and ``X-Sample-Rates`` headers
+    (comma-separated, same order) let the client split the buffer.
+
+    Args:
+        arrays: Mapping of channel ID to sample array
+        sample_rates: Mapping of channel ID to samples per second
+
+    Returns:
+        application/octet-stream response
+    """
+    channel_ids = list(arrays)
+    flat = [
+        np.asarray(arrays[cid]).astype(BINARY_DTYPE, copy=False).ravel()
+        for cid in channel_ids
+    ]
+    content = np.concatenate(flat).tobytes() if flat else b""
+    return Response(
+        content=content,
+        media_type=OCTET_STREAM,
+        headers={
+            "X-Dtype": "float32",
+            "X-Channel-Ids": ",".join(channel_ids),
+            "X-Channel-Lengths": ",".join(str(len(a)) for a in flat),
+            "X-Sample-Rates": ",".join(str(sample_rates[cid]) for cid in channel_ids),
+        },
+    )
@@ -7,6 +7,7 @@ This module handles initialization tasks that run when the server starts:
 """
 
 import logging
+import os
 from pathlib import Path
 
 from app_meshed.services.function_registry import get_global_registry
@@ -20,7 +21,7 @@ def register_example_functions():
     """Register all example functions in the global registry."""
     registry = get_global_registry()
 
-    for func_name, func in EXAMPLE_FUNCTIONS:
+    for func_name, func in EXAMPLE_FUNCTIONS.items():
         try:
             registry.register(func_name, func, override=True)
             logger.info(f"Registered function: {func_name}")
@@ -39,6 +40,7 @@ def initialize_sample_streams(data_path: str = "./data"):
     import numpy as np
 
     stream_registry = get_stream_registry()
+    rng = np.random.default_rng()
     data_dir = Path(data_path) / "raw_data"
     data_dir.mkdir(parents=True, exist_ok=True)
 
@@ -71,16 +73,22 @@ def initialize_sample_streams(data_path: str = "./data"):
         file_path = data_dir / f"{stream_id}.npy"
 
         if not file_path.exists():
-            # Create synthetic data
+            # Create synthetic data (float32 halves file and cache size)
             if "audio" in stream_id:
                 # Generate a simple sine wave
-                t = np.linspace(0, duration, num_samples)
-                data = np.sin(2 * np.pi * 440 * t)  # 440 Hz tone
+                t = np.linspace(0, duration, num_samples, dtype=np.float32)
+                data = np.sin(np.float32(2 * np.pi * 440) * t, dtype=np.float32)
             else:
                 # Generate random sensor data
-                data = np.random.randn(num_samples) * 0.1
-
-            np.save(file_path, data)
+                data = rng.standard_normal(num_samples, dtype=np.float32)
+                data *= np.float32(0.1)
+
+            # Write to a temporary file and rename, so that concurrently
+            # starting workers never read a partially written file
+            tmp_path = file_path.with_suffix(f".{os.getpid()}.tmp")
+            with open(tmp_path, "wb") as f:
+                np.save(f, data, allow_pickle=False)
+            os.replace(tmp_path, file_path)
             logger.info(f"Created sample data: {file_path}")
 
         # Register the stream
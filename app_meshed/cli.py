@@ -10,6 +10,23 @@ import logging
 
 import uvicorn
 
+# Prefer the C-accelerated event loop and HTTP parser (both ship with
+# uvicorn[standard]); fall back to uvicorn's defaults where they're missing,
+# e.g. uvloop on Windows
+try:
+    import uvloop  # noqa: F401
+
+    LOOP = "uvloop"
+except ImportError:
+    LOOP = "auto"
+
+try:
+    import httptools  # noqa: F401
+
+    HTTP = "httptools"
+except ImportError:
+    HTTP = "auto"
+
 
 def setup_logging(level: str = "INFO"):
     """Set up logging configuration.
@@ -41,6 +58,9 @@ Examples:
 
   # Specify data directory
   python -m app_meshed.cli --data-path /path/to/data
+
+  # Run 4 worker processes
+  python -m app_meshed.cli --workers 4
         """,
     )
 
@@ -63,6 +83,16 @@ Examples:
         help="Path for data storage (default: ./data)",
     )
 
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help=(
+            "Number of worker processes (default: number of CPUs). "
+            "Ignored with --reload"
+        ),
+    )
+
     parser.add_argument(
         "--reload",
         action="store_true",
@@ -89,6 +119,10 @@ Examples:
 
     # Set data path environment variable
     os.environ["APP_MESHED_DATA_PATH"] = args.data_path
+    # Tell the app how many server processes share the CPUs (it sizes its
+    # DAG process pool accordingly)
+    workers = 1 if args.reload else args.workers
+    os.environ["APP_MESHED_SERVER_WORKERS"] = str(workers)
 
     # Print startup info
     print("=" * 60)
@@ -99,19 +133,25 @@ Examples:
     print(f"Data Path: {args.data_path}")
     print(f"Debug: {args.debug}")
     print(f"Auto-reload: {args.reload}")
+    print(f"Workers: {workers}")
+    print(f"Event loop: {LOOP}, HTTP parser: {HTTP}")
     print("=" * 60)
     print(f"\nServer starting at: http://{args.host}:{args.port}")
     print(f"API Documentation: http://{args.host}:{args.port}/docs")
     print("=" * 60)
     print()
 
-    # Run the server
+    # Run the server. With several workers, each is a separate process (own
+    # event loop, GIL and registries) sharing the listening socket.
     uvicorn.run(
         "app_meshed.api.main:app",
         host=args.host,
         port=args.port,
         reload=args.reload,
+        workers=None if args.reload else workers,
         log_level=args.log_level.lower(),
+        loop=LOOP,
+        http=HTTP,
     )
 
 
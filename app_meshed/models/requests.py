@@ -0,0 +1,47 @@
+"""Request body models for the hot API endpoints.
+
+These are msgspec Structs rather than pydantic models: msgspec decodes and
+validates JSON in C, in one pass, which keeps request parsing cheap on
+endpoints that are called at high rates (DAG execution/validation, stream
+slicing).
+"""
+
+from typing import Any, Dict, List, Literal
+
+try:
+    import msgspec
+except ImportError:
+    raise ImportError("msgspec is required. Install with: pip install msgspec")
+
+
+class DagExecuteRequest(msgspec.Struct):
+    """Body of POST /dag/execute."""
+
+    dag_config: Dict[str, Any]
+    inputs: Dict[str, Any] = {}
+
+
+class MultiChannelSliceRequest(msgspec.Struct):
+    """Body of POST /streams/multi-channel/slice."""
+
+    channel_ids: List[str]
+    bt: float = 0.0
+    tt: float = 10.0
+    format: Literal["list", "b64"] = "list"
+    layout: Literal["channels", "stacked"] = "channels"
+
+
+def json_body_schema(model: Any) -> Dict:
+    """Get an inline JSON Schema for a request body type.
+
+    Args:
+        model: msgspec Struct (or any type msgspec supports)
+
+    Returns:
+        JSON Schema dict, with the model's definition inlined
+    """
+    schema = msgspec.json.schema(model)
+    defs = schema.pop("$defs", {})
+    if "$ref" in schema:
+        return defs[schema["$ref"].rsplit("/", 1)[-1]]
+    return schema
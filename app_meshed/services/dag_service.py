@@ -6,18 +6,136 @@ This module provides:
 - DAG execution
 """
 
-from typing import Any, Dict, List, Optional, Callable
+from typing import Any, Dict, List, Optional, Callable, Tuple
+from collections import OrderedDict
+from functools import partial
+import hashlib
 import json
+import pickle
+
+import orjson
 
 try:
-    from meshed import DAG
+    from meshed import DAG, FuncNode
     from meshed.makers import code_to_dag
+    from meshed.util import parameter_merger
 except ImportError:
     raise ImportError("meshed is required. Install with: pip install meshed")
 
 from app_meshed.services.function_registry import FunctionRegistry
 
 
+# Same-named inputs of different nodes are fed by a single DAG input, even if
+# their annotations or defaults differ (e.g. add(b: int) and multiply(b: float))
+_lenient_parameter_merge = partial(
+    parameter_merger, same_kind=False, same_default=False, same_annotation=False
+)
+
+
+def node_param_input(node_id: str, param: str) -> str:
+    """Name of the DAG input feeding a node-scoped parameter.
+
+    Args:
+        node_id: Node identifier
+        param: Parameter name of the node's function
+
+    Returns:
+        DAG input name, e.g. "step2__b"
+    """
+    return f"{node_id}__{param}"
+
+
+def scope_node_params(
+    dag_config: Dict, inputs: Dict[str, Any]
+) -> Tuple[Dict, Dict[str, Any]]:
+    """Turn node params into node-scoped DAG inputs.
+
+    Functions of different nodes often share parameter names (e.g. ``b`` of
+    add and multiply), which meshed merges into one DAG input. Params given
+    for a node, in the config's "params" or as an input keyed by the node ID
+    (with a dict value, overriding the config's), instead feed only that
+    node, through their own input named by node_param_input.
+
+    Param values are moved to the inputs, and only their names kept in the
+    returned config, so configs differing only in param values build (and
+    cache) the same DAG.
+
+    Args:
+        dag_config: DAG configuration (see DAGService.json_to_dag)
+        inputs: Input values for execution
+
+    Returns:
+        (dag_config, dag_inputs) tuple: the config to build the DAG from,
+        and the inputs to call it with
+    """
+    node_ids = {node["id"] for node in dag_config.get("nodes", [])}
+    params = {
+        node_id: dict(node_params)
+        for node_id, node_params in dag_config.get("params", {}).items()
+    }
+    dag_inputs = {}
+    for key, value in inputs.items():
+        if key in node_ids and isinstance(value, dict):
+            params.setdefault(key, {}).update(value)
+        else:
+            dag_inputs[key] = value
+    for node_id, node_params in params.items():
+        for param, value in node_params.items():
+            dag_inputs[node_param_input(node_id, param)] = value
+
+    dag_config = {
+        **dag_config,
+        "params": {n: dict.fromkeys(p) for n, p in params.items()},
+    }
+    return dag_config, dag_inputs
+
+
+def run_dag(dag: DAG, inputs: Dict[str, Any]) -> Any:
+    """Call a DAG with given inputs.
+
+    A module-level function (rather than a method) so it can be shipped to
+    worker processes along with a picklable DAG.
+
+    Args:
+        dag: DAG to execute
+        inputs: Dictionary of input values
+
+    Returns:
+        DAG execution result
+    """
+    try:
+        return dag(**inputs)
+    except Exception as e:
+        raise RuntimeError(f"DAG execution failed: {str(e)}")
+
+
+class DAGLoadError(RuntimeError):
+    """A pickled DAG couldn't be loaded (so it was not run)."""
+
+
+def run_pickled_dag(payload: bytes) -> Any:
+    """Load a pickled (dag, inputs) pair and call the DAG.
+
+    The worker-process counterpart of run_dag: the caller pickles (and so
+    checks) the DAG before submitting it, and a DAGLoadError tells it that
+    the DAG never ran, e.g. because its functions can't be imported here.
+
+    Args:
+        payload: pickle of (dag, inputs)
+
+    Returns:
+        DAG execution result
+
+    Raises:
+        DAGLoadError: If the payload can't be unpickled
+    """
+    try:
+        dag, inputs = pickle.loads(payload)
+    except Exception as e:
+        raise DAGLoadError(f"Could not load DAG: {e}") from None
+    return run_dag(dag, inputs)
+
+
 class DAGService:
     """Service for managing and executing meshed DAGs.
 
@@ -25,15 +143,26 @@ class DAGService:
     - Converting JSON configs to live DAG objects
     - Executing DAGs with provided inputs
     - Serializing DAG definitions
+
+    Built DAGs are cached (LRU, up to dag_cache_size entries) on a hash of
+    the canonical JSON config and the function registry version, so
+    identical configs are only built once per registry state.
     """
 
-    def __init__(self, function_registry: FunctionRegistry):
+    def __init__(self, function_registry: FunctionRegistry, dag_cache_size: int = 256):
         """Initialize the DAG service.
 
         Args:
             function_registry: Registry of available functions
+            dag_cache_size: Maximum number of built DAGs to keep cached
         """
         self.function_registry = function_registry
+        self.dag_cache_size = dag_cache_size
+        self._dag_cache: OrderedDict[Tuple[int, bytes], DAG] = OrderedDict()
+
+    def clear_cache(self) -> None:
+        """Drop all cached DAGs."""
+        self._dag_cache.clear()
 
     def json_to_dag(self, dag_config: Dict) -> DAG:
         """Convert a JSON configuration to a meshed.DAG object.
@@ -64,12 +193,99 @@ class DAGService:
                     }
                 }
 
+                Each node's output is named after the node, so an edge
+                feeds the target's targetInput with the source's output.
+                Parameters listed under "params" get their own DAG input,
+                named by node_param_input (e.g. "node1__a"), instead of
+                being shared with same-named parameters of other nodes
+                (see scope_node_params, which fills them in as inputs).
+
         Returns:
             Constructed DAG object
 
         Raises:
             ValueError: If configuration is invalid
         """
+        try:
+            config_bytes = orjson.dumps(dag_config, option=orjson.OPT_SORT_KEYS)
+        except TypeError:
+            # Not JSON-serializable, so no canonical key: build uncached
+            return self._build_dag(dag_config)
+
+        key = (
+            self.function_registry.version,
+            hashlib.blake2b(config_bytes, digest_size=16).digest(),
+        )
+        dag = self._dag_cache.get(key)
+        if dag is not None:
+            self._dag_cache.move_to_end(key)
+            return dag
+
+        dag = self._build_dag(dag_config)
+        self._dag_cache[key] = dag
+        if len(self._dag_cache) > self.dag_cache_size:
+            self._dag_cache.popitem(last=False)
+        return dag
+
+    def fast_validate(self, dag_config: Dict) -> List[str]:
+        """Check a DAG configuration's shape without building the DAG.
+
+        Checks that nodes are well-formed with unique IDs and registered
+        functions, and that edges and params only reference declared nodes.
+        This is much cheaper than json_to_dag, but doesn't catch errors that
+        only show when meshed wires the functions together.
+
+        Args:
+            dag_config: DAG configuration (see json_to_dag)
+
+        Returns:
+            List of error messages (empty if no problem was found)
+        """
+        nodes = dag_config.get("nodes", [])
+        edges = dag_config.get("edges", [])
+        params = dag_config.get("params", {})
+        if not isinstance(nodes, list) or not nodes:
+            return ["DAG must have at least one node"]
+
+        errors = []
+        node_ids = set()
+        for i, node in enumerate(nodes):
+            if not (isinstance(node, dict) and "id" in node and "function" in node):
+                errors.append(f"Node {i} must be an object with 'id' and 'function'")
+                continue
+            node_id, func_name = node["id"], node["function"]
+            if node_id in node_ids:
+                errors.append(f"Duplicate node id '{node_id}'")
+            node_ids.add(node_id)
+            if func_name not in self.function_registry:
+                errors.append(
+                    f"Function '{func_name}' not found in registry for node '{node_id}'"
+                )
+
+        if not isinstance(edges, list):
+            errors.append("'edges' must be a list")
+            edges = []
+        for i, edge in enumerate(edges):
+            if not (isinstance(edge, dict) and "source" in edge and "target" in edge):
+                errors.append(f"Edge {i} must be an object with 'source' and 'target'")
+                continue
+            for end in ("source", "target"):
+                if edge[end] not in node_ids:
+                    errors.append(
+                        f"Edge {i} {end} '{edge[end]}' is not a declared node"
+                    )
+
+        if not isinstance(params, dict):
+            errors.append("'params' must be an object")
+        else:
+            for node_id in params:
+                if node_id not in node_ids:
+                    errors.append(f"Params given for undeclared node '{node_id}'")
+
+        return errors
+
+    def _build_dag(self, dag_config: Dict) -> DAG:
+        """Build a DAG from a configuration (uncached, see json_to_dag)."""
         name = dag_config.get("name", "unnamed_dag")
         nodes = dag_config.get("nodes", [])
         edges = dag_config.get("edges", [])
@@ -105,9 +321,20 @@ class DAGService:
 
             binds[target][target_input] = source
 
-        # Create the DAG
+        # Node-scoped params are fed by their own inputs
+        for node_id, node_params in params.items():
+            for param in node_params:
+                binds.setdefault(node_id, {}).setdefault(
+                    param, node_param_input(node_id, param)
+                )
+
+        # Create the DAG (each node's output is named after the node)
         try:
-            dag = DAG(funcs, **binds)
+            func_nodes = [
+                FuncNode(func, name=node_id, out=node_id, bind=binds.get(node_id, {}))
+                for node_id, func in funcs.items()
+            ]
+            dag = DAG(func_nodes, name=name, parameter_merge=_lenient_parameter_merge)
             return dag
         except Exception as e:
             raise ValueError(f"Error creating DAG: {str(e)}")
@@ -144,11 +371,22 @@ class DAGService:
         Returns:
             DAG execution result
         """
-        try:
-            result = dag(**inputs)
-            return result
-        except Exception as e:
-            raise RuntimeError(f"DAG execution failed: {str(e)}")
+        return run_dag(dag, inputs)
+
+    def compile_from_config(
+        self, dag_config: Dict, inputs: Dict[str, Any]
+    ) -> Tuple[DAG, Dict[str, Any]]:
+        """Get the DAG for a configuration and the inputs to call it with.
+
+        Args:
+            dag_config: DAG configuration
+            inputs: Input values for execution (see scope_node_params)
+
+        Returns:
+            (dag, dag_inputs) tuple, to be executed as dag(**dag_inputs)
+        """
+        dag_config, dag_inputs = scope_node_params(dag_config, inputs)
+        return self.json_to_dag(dag_config), dag_inputs
 
     def execute_from_config(
         self, dag_config: Dict, inputs: Dict[str, Any]
@@ -157,14 +395,14 @@ class DAGService:
 
         Args:
             dag_config: DAG configuration
-            inputs: Input values for execution
+            inputs: Input values for execution (see compile_from_config)
 
         Returns:
             Dictionary with execution result and metadata
         """
         try:
-            dag = self.json_to_dag(dag_config)
-            result = self.execute_dag(dag, inputs)
+            dag, dag_inputs = self.compile_from_config(dag_config, inputs)
+            result = self.execute_dag(dag, dag_inputs)
 
             return {
                 "status": "success",
@@ -5,21 +5,25 @@ It uses i2 to ensure clean, inspectable signatures and provides metadata about
 each function's parameters, types, and documentation.
 """
 
-from typing import Any, Callable, Dict, List, Optional
-from dataclasses import dataclass, asdict
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
+from dataclasses import dataclass
+from functools import cache, lru_cache
+from weakref import WeakKeyDictionary
 import inspect
+import sys
 
-try:
-    from i2 import Sig
-except ImportError:
-    raise ImportError(
-        "i2 is required for function introspection. Install with: pip install i2"
-    )
+import orjson
+
+from app_meshed.utils.signatures import attach_signature, get_params
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ParameterInfo:
-    """Information about a function parameter."""
+    """Information about a function parameter.
+
+    Frozen, since instances are shared by every registration of a function.
+    """
     name: str
     annotation: str
     default: Optional[Any] = None
@@ -37,7 +41,7 @@ class ParameterInfo:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class FunctionMetadata:
     """Metadata about a registered function."""
     name: str
@@ -57,6 +61,51 @@ class FunctionMetadata:
         }
 
 
+_EMPTY = inspect.Parameter.empty  # same object as inspect.Signature.empty
+_MISSING = object()
+_KIND_NAMES = {
+    kind: kind.name
+    for kind in (
+        inspect.Parameter.POSITIONAL_ONLY,
+        inspect.Parameter.POSITIONAL_OR_KEYWORD,
+        inspect.Parameter.VAR_POSITIONAL,
+        inspect.Parameter.KEYWORD_ONLY,
+        inspect.Parameter.VAR_KEYWORD,
+    )
+}
+
+
+def _uncached_ann_to_str(ann: Any) -> str:
+    if ann is _EMPTY:
+        return "Any"
+    try:
+        return sys.intern(ann.__name__)
+    except AttributeError:
+        return sys.intern(str(ann))
+
+
+_cached_ann_to_str = lru_cache(maxsize=512)(_uncached_ann_to_str)
+
+
+def _ann_to_str(ann: Any) -> str:
+    """Get the display string of an annotation ("Any" if there is none).
+
+    Annotation objects (int, str, np.ndarray...) are shared by many
+    functions, so the strings are cached per annotation, and interned so
+    that equal strings from distinct annotations are stored once.
+    """
+    try:
+        return _cached_ann_to_str(ann)
+    except TypeError:  # unhashable annotation
+        return _uncached_ann_to_str(ann)
+
+
+# Name-independent metadata (parameters, return annotation, doc, module) per
+# function object, so re-registering a callable skips introspection.
+_MetadataCore = Tuple[Tuple[ParameterInfo, ...], str, Optional[str], Optional[str]]
+_METADATA_CORE_CACHE: "WeakKeyDictionary[Callable, _MetadataCore]" = WeakKeyDictionary()
+
+
 class FunctionRegistry:
     """Registry for functions with i2 signature introspection.
 
@@ -75,8 +124,22 @@ class FunctionRegistry:
 
     def __init__(self):
         """Initialize the function registry."""
-        self._functions: Dict[str, Callable] = {}
-        self._metadata: Dict[str, FunctionMetadata] = {}
+        # name -> (function, metadata), both set together on register
+        self._entries: Dict[str, Tuple[Callable, FunctionMetadata]] = {}
+        self._metadata_dict: Dict[str, Dict] = {}
+        self._metadata_view = MappingProxyType(self._metadata_dict)
+        self._version = 0
+        self._names: Optional[Tuple[str, ...]] = None
+        self._listing_bytes: Optional[bytes] = None
+
+    @property
+    def version(self) -> int:
+        """Counter bumped on every register/unregister.
+
+        Caches derived from the registry can include it in their keys so
+        they never serve results computed before a mutation.
+        """
+        return self._version
 
     def register(self, name: str, func: Callable, *, override: bool = False) -> None:
         """Register a function in the registry.
@@ -89,20 +152,26 @@ class FunctionRegistry:
         Raises:
             ValueError: If function already registered and override=False
         """
-        if name in self._functions and not override:
+        if not override and name in self._entries:
             raise ValueError(
                 f"Function '{name}' already registered. Use override=True to replace."
             )
 
-        # Store the function
-        self._functions[name] = func
-
-        # Extract metadata using i2.Sig
-        self._metadata[name] = self._extract_metadata(name, func)
+        # Extract metadata (once, here, so reads are plain lookups)
+        metadata = self._extract_metadata(name, func)
+        self._entries[name] = (func, metadata)
+        # ... and pin the signature on the function for other introspectors
+        attach_signature(func)
+        self._metadata_dict[name] = metadata.to_dict()
+        self._version += 1
+        self._names = None
+        self._listing_bytes = None
 
     def _extract_metadata(self, name: str, func: Callable) -> FunctionMetadata:
         """Extract metadata from a function using i2.Sig.
 
+        The name-independent part is cached per function object.
+
         Args:
             name: Function name
             func: The callable
@@ -110,54 +179,58 @@ class FunctionRegistry:
         Returns:
             FunctionMetadata with extracted information
         """
-        # Get signature using i2
-        sig = Sig(func)
-
-        # Extract parameters
-        parameters = []
-        for param_name in sig.names:
-            param = sig.params[param_name]
-
-            # Get annotation as string
-            annotation = "Any"
-            if param.annotation != inspect.Parameter.empty:
-                annotation = (
-                    param.annotation.__name__
-                    if hasattr(param.annotation, "__name__")
-                    else str(param.annotation)
-                )
-
-            # Check for default value
-            has_default = param.default != inspect.Parameter.empty
-            default = param.default if has_default else None
-
-            parameters.append(
-                ParameterInfo(
-                    name=param_name,
-                    annotation=annotation,
-                    default=default,
-                    has_default=has_default,
-                    kind=param.kind.name,
-                )
-            )
-
-        # Extract return annotation
-        return_annotation = "Any"
-        if sig.return_annotation != inspect.Signature.empty:
-            return_annotation = (
-                sig.return_annotation.__name__
-                if hasattr(sig.return_annotation, "__name__")
-                else str(sig.return_annotation)
-            )
-
+        try:
+            core = _METADATA_CORE_CACHE.get(func)
+        except TypeError:  # not weak-referenceable or not hashable
+            core = self._extract_metadata_core(func)
+        else:
+            if core is None:
+                core = _METADATA_CORE_CACHE[func] = self._extract_metadata_core(func)
+
+        parameters, return_annotation, doc, module = core
         return FunctionMetadata(
             name=name,
-            doc=inspect.getdoc(func),
-            parameters=parameters,
+            doc=doc,
+            parameters=list(parameters),
             return_annotation=return_annotation,
-            module=func.__module__ if hasattr(func, "__module__") else None,
+            module=module,
         )
 
+    @staticmethod
+    def _extract_metadata_core(func: Callable) -> _MetadataCore:
+        """Introspect the name-independent metadata of a function.
+
+        Args:
+            func: The callable
+
+        Returns:
+            Tuple of (parameters, return_annotation, doc, module)
+        """
+        # Get parameters (straight from __code__ for plain functions, else i2)
+        params, sig_return_annotation = get_params(func)
+
+        parameters = tuple(
+            ParameterInfo(
+                name=sys.intern(param.name),
+                annotation=_ann_to_str(param.annotation),
+                default=None if param.default is _EMPTY else param.default,
+                has_default=param.default is not _EMPTY,
+                kind=_KIND_NAMES[param.kind],
+            )
+            for param in params
+        )
+
+        return (
+            parameters,
+            _ann_to_str(sig_return_annotation),
+            inspect.getdoc(func),
+            func.__module__ if hasattr(func, "__module__") else None,
+        )
+
+    def __contains__(self, name: str) -> bool:
+        """Check whether a function is registered under name."""
+        return name in self._entries
+
     def get_function(self, name: str) -> Callable:
         """Get a registered function by name.
 
@@ -170,9 +243,29 @@ class FunctionRegistry:
         Raises:
             KeyError: If function not found
         """
-        if name not in self._functions:
-            raise KeyError(f"Function '{name}' not found in registry")
-        return self._functions[name]
+        try:
+            return self._entries[name][0]
+        except KeyError:
+            raise KeyError(f"Function '{name}' not found in registry") from None
+
+    def invoke(self, name: str, kwargs: Dict[str, Any]) -> Any:
+        """Call a registered function with keyword arguments.
+
+        Args:
+            name: Function name
+            kwargs: Arguments, by parameter name
+
+        Returns:
+            What the function returns
+
+        Raises:
+            KeyError: If function not found
+        """
+        try:
+            func = self._entries[name][0]
+        except KeyError:
+            raise KeyError(f"Function '{name}' not found in registry") from None
+        return func(**kwargs)
 
     def get_metadata(self, name: str) -> FunctionMetadata:
         """Get metadata for a registered function.
@@ -186,17 +279,22 @@ class FunctionRegistry:
         Raises:
             KeyError: If function not found
         """
-        if name not in self._metadata:
-            raise KeyError(f"Function '{name}' not found in registry")
-        return self._metadata[name]
+        try:
+            return self._entries[name][1]
+        except KeyError:
+            raise KeyError(f"Function '{name}' not found in registry") from None
 
-    def list_functions(self) -> List[str]:
+    def list_functions(self) -> Tuple[str, ...]:
         """List all registered function names.
 
+        The tuple is built once per register/unregister and then reused.
+
         Returns:
-            List of function names
+            Tuple of function names
         """
-        return list(self._functions.keys())
+        if self._names is None:
+            self._names = tuple(self._entries)
+        return self._names
 
     def unregister(self, name: str) -> None:
         """Remove a function from the registry.
@@ -207,23 +305,42 @@ class FunctionRegistry:
         Raises:
             KeyError: If function not found
         """
-        if name not in self._functions:
+        if self._entries.pop(name, _MISSING) is _MISSING:
             raise KeyError(f"Function '{name}' not found in registry")
 
-        del self._functions[name]
-        del self._metadata[name]
+        self._metadata_dict.pop(name, None)
+        self._version += 1
+        self._names = None
+        self._listing_bytes = None
 
-    def get_all_metadata(self) -> Dict[str, Dict]:
+    def get_all_metadata(self) -> Mapping[str, Dict]:
         """Get metadata for all registered functions.
 
+        The dict form of each function's metadata is computed once, on
+        register. The mapping is a live, read-only view of the registry's
+        own: it reflects later (un)registrations, and is never copied.
+
         Returns:
-            Dictionary mapping function names to metadata dicts
+            Mapping of function names to metadata dicts
         """
-        return {name: meta.to_dict() for name, meta in self._metadata.items()}
+        return self._metadata_view
+
+    def get_listing_bytes(self) -> bytes:
+        """Get the JSON-encoded listing of all functions and their metadata.
 
+        The encoding is cached until the next register/unregister.
 
-# Create a global registry instance
-_global_registry = FunctionRegistry()
+        Returns:
+            JSON bytes of {"functions": [...], "metadata": {...}}
+        """
+        if self._listing_bytes is None:
+            self._listing_bytes = orjson.dumps(
+                {
+                    "functions": self.list_functions(),
+                    "metadata": self._metadata_dict,
+                }
+            )
+        return self._listing_bytes
 
 
 def register_function(name: str, func: Callable, *, override: bool = False) -> None:
@@ -234,13 +351,16 @@ def register_function(name: str, func: Callable, *, override: bool = False) -> N
         func: The callable to register
         override: If True, allow overriding existing registrations
     """
-    _global_registry.register(name, func, override=override)
+    get_global_registry().register(name, func, override=override)
 
 
+@cache
 def get_global_registry() -> FunctionRegistry:
     """Get the global function registry instance.
 
+    The registry is created on first use, not on import.
+
     Returns:
         The global FunctionRegistry
     """
-    return _global_registry
+    return FunctionRegistry()
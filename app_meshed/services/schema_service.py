@@ -1,64 +1,165 @@
-"""Schema generation service using ju (JSON Schema utilities).
+"""Schema generation service (JSON Schema for RJSF forms).
 
 This module provides schema generation from:
-- Function signatures (via i2 + ju)
+- Function signatures (via app_meshed.utils.signatures)
 - Python objects
 - Custom types
 
 Schemas are used to generate forms in the frontend (RJSF).
 """
 
-from typing import Any, Callable, Dict, Optional, get_type_hints
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Optional
+from functools import cache, lru_cache
+from weakref import WeakKeyDictionary
+import array
 import inspect
+import json
 
-try:
-    from i2 import Sig
-except ImportError:
-    raise ImportError("i2 is required. Install with: pip install i2")
+import numpy as np
 
-try:
-    import ju
-except ImportError:
-    # ju might not have a direct func_to_schema, we'll implement a fallback
-    ju = None
+from app_meshed.utils.signatures import get_params
+
+# ju is not imported: schemas are generated by SchemaGenerator below, and
+# importing ju (which pulls in ipywidgets) takes about half a second.
+
+
+_EMPTY = inspect.Parameter.empty
+
+_PY_TO_JSON_TYPE = MappingProxyType(
+    {
+        int: "integer",
+        float: "number",
+        str: "string",
+        bool: "boolean",
+        list: "array",
+        dict: "object",
+        type(None): "null",
+    }
+)
+
+
+@lru_cache(maxsize=256)
+def _py_type_to_json(py_type: Any) -> str:
+    """Convert Python type to JSON Schema type (see python_type_to_json_type)."""
+    # Handle typing module types
+    if hasattr(py_type, "__origin__"):
+        origin = py_type.__origin__
+        if origin in (list, List):
+            return "array"
+        elif origin in (dict, Dict):
+            return "object"
+
+    return _PY_TO_JSON_TYPE.get(py_type, "string")
+
+
+# Leaf types, whose values all have the same schema
+_PRIMITIVE_TYPES = frozenset({int, float, str, bool, type(None)})
+
+# JSON type of the items of numpy arrays (by dtype kind) and array.array
+# (by typecode)
+_DTYPE_KIND_TO_JSON = MappingProxyType(
+    {"b": "boolean", "i": "integer", "u": "integer", "f": "number"}
+)
+_ARRAY_TYPECODE_TO_JSON = MappingProxyType(
+    {"f": "number", "d": "number", "u": "string", "w": "string"}
+)
+
+
+def _dtype_to_json(dtype: np.dtype) -> str:
+    """Get the JSON Schema type of the items of a numpy array."""
+    return _DTYPE_KIND_TO_JSON.get(dtype.kind, "string")
+
+
+def _param_schema(param: Any) -> Dict:
+    """Get the property schema of a function parameter (see function_to_schema).
+
+    Unannotated parameters are strings; defaults other than None are included.
+    """
+    if param.annotation is _EMPTY:
+        param_type = "string"
+    else:
+        param_type = _py_type_to_json(param.annotation)
+    if param.default is _EMPTY or param.default is None:
+        return {"type": param_type}
+    return {"type": param_type, "default": param.default}
+
+
+_DAG_CONFIG_SCHEMA: Dict = {
+    "type": "object",
+    "title": "DAG Configuration",
+    "properties": {
+        "name": {
+            "type": "string",
+            "title": "DAG Name",
+            "description": "Name of the DAG",
+        },
+        "nodes": {
+            "type": "array",
+            "title": "Nodes",
+            "description": "Function nodes in the DAG",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "id": {"type": "string"},
+                    "function": {"type": "string"},
+                    "params": {"type": "object"},
+                },
+                "required": ["id", "function"],
+            },
+        },
+        "edges": {
+            "type": "array",
+            "title": "Edges",
+            "description": "Connections between nodes",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "source": {"type": "string"},
+                    "target": {"type": "string"},
+                    "sourceOutput": {"type": "string"},
+                    "targetInput": {"type": "string"},
+                },
+                "required": ["source", "target"],
+            },
+        },
+    },
+    "required": ["name", "nodes"],
+}
+_DAG_CONFIG_SCHEMA_JSON = json.dumps(_DAG_CONFIG_SCHEMA).encode()
 
 
 class SchemaGenerator:
     """Generate JSON Schemas from various sources.
 
-    This class uses ju and i2 to convert Python types, function signatures,
-    and objects into JSON Schema format suitable for RJSF form generation.
+    This class converts Python types, function signatures (read with
+    app_meshed.utils.signatures.get_params) and objects into JSON Schema
+    format suitable for RJSF form generation.
     """
 
+    def __init__(self, list_sample_size: int = 1):
+        """Initialize the schema generator.
+
+        Args:
+            list_sample_size: Number of (evenly spaced) items of a list to
+                infer its item schema from. Differing item schemas are
+                combined with anyOf.
+        """
+        self.list_sample_size = list_sample_size
+
     @staticmethod
     def python_type_to_json_type(py_type: Any) -> str:
         """Convert Python type to JSON Schema type.
 
+        Results are memoized per type.
+
         Args:
             py_type: Python type annotation
 
         Returns:
             JSON Schema type string
         """
-        type_mapping = {
-            int: "integer",
-            float: "number",
-            str: "string",
-            bool: "boolean",
-            list: "array",
-            dict: "object",
-            type(None): "null",
-        }
-
-        # Handle typing module types
-        if hasattr(py_type, "__origin__"):
-            origin = py_type.__origin__
-            if origin in (list, List):
-                return "array"
-            elif origin in (dict, Dict):
-                return "object"
-
-        return type_mapping.get(py_type, "string")
+        return _py_type_to_json(py_type)
 
     @staticmethod
     def get_default_value(param: inspect.Parameter) -> Optional[Any]:
@@ -70,7 +171,7 @@ class SchemaGenerator:
         Returns:
             Default value or None
         """
-        if param.default != inspect.Parameter.empty:
+        if param.default is not _EMPTY:
             return param.default
         return None
 
@@ -84,46 +185,33 @@ class SchemaGenerator:
         Returns:
             JSON Schema dict suitable for RJSF
         """
-        sig = Sig(func)
+        params, _ = get_params(func)
+        # A default of None counts as no default: the parameter is required
         schema = {
             "type": "object",
             "title": title or func.__name__,
-            "properties": {},
-            "required": [],
+            "properties": {param.name: _param_schema(param) for param in params},
+            "required": [
+                param.name
+                for param in params
+                if param.default is _EMPTY or param.default is None
+            ],
         }
 
         # Add description from docstring
         if func.__doc__:
             schema["description"] = func.__doc__.strip()
 
-        # Process each parameter
-        for param_name in sig.names:
-            param = sig.params[param_name]
-
-            # Get type annotation
-            param_type = "string"  # default
-            if param.annotation != inspect.Parameter.empty:
-                param_type = self.python_type_to_json_type(param.annotation)
-
-            # Build property schema
-            prop_schema = {"type": param_type}
-
-            # Add default if available
-            default = self.get_default_value(param)
-            if default is not None:
-                prop_schema["default"] = default
-            else:
-                # No default = required parameter
-                schema["required"].append(param_name)
-
-            # Add to properties
-            schema["properties"][param_name] = prop_schema
-
         return schema
 
     def object_to_schema(self, obj: Any, title: Optional[str] = None) -> Dict:
         """Generate JSON Schema from a Python object.
 
+        Nested containers are walked with an explicit stack rather than by
+        recursion, so deeply nested objects don't hit the recursion limit.
+        A container that (directly or not) contains itself gets an empty
+        schema where it reoccurs.
+
         Args:
             obj: Object to generate schema for
             title: Optional title for the schema
@@ -131,136 +219,155 @@ class SchemaGenerator:
         Returns:
             JSON Schema dict
         """
-        if isinstance(obj, dict):
-            return self._dict_to_schema(obj, title)
-        elif isinstance(obj, list):
-            return self._list_to_schema(obj, title)
-        else:
-            return self._value_to_schema(obj, title)
+        # Work items are ("enter", container, schema) and, once a container
+        # is being filled, ("exit", container, item schemas to merge or None).
+        # Children are pushed above their parent's "exit", so _seen holds the
+        # containers on the current path, as it would when recursing.
+        stack: List[tuple] = []
+        _seen: set = set()
+        root = self._schema_shell(obj, title, stack)
+        while stack:
+            action, container, payload = stack.pop()
+            if action == "exit":
+                _seen.discard(id(container))
+                if payload is not None:
+                    self._merge_item_schemas(*payload)
+                continue
+            if id(container) in _seen or not container:
+                continue  # self-reference, or empty: leave the schema empty
+            _seen.add(id(container))
+            if isinstance(container, dict):
+                stack.append(("exit", container, None))
+                properties = payload["properties"]
+                for key, value in container.items():
+                    properties[key] = self._schema_shell(value, key, stack)
+            else:
+                self._fill_list_schema(container, payload, stack)
+        return root
+
+    def _schema_shell(self, value: Any, title: Any, stack: List[tuple]) -> Dict:
+        """Make the schema of value, leaving its contents to be filled.
 
-    def _dict_to_schema(self, obj: dict, title: Optional[str] = None) -> Dict:
-        """Generate schema from a dictionary.
+        Leaves (and numpy / ``array.array`` arrays) get their full schema;
+        dicts and lists get an empty one, and are pushed onto stack.
 
         Args:
-            obj: Dictionary object
-            title: Optional title
+            value: Value to generate schema for
+            title: Optional title (for dicts, the key of value)
+            stack: Work stack of object_to_schema
 
         Returns:
             JSON Schema dict
         """
-        schema = {
-            "type": "object",
-            "title": title or "Object",
-            "properties": {},
-        }
+        py_type = type(value)
+        if py_type in _PRIMITIVE_TYPES:  # exact-type lookup for the common leaves
+            schema = {"type": _PY_TO_JSON_TYPE[py_type]}
+            if title:
+                schema["title"] = title
+            return schema
+        if isinstance(value, dict):
+            schema = {"type": "object", "title": title or "Object", "properties": {}}
+            stack.append(("enter", value, schema))
+            return schema
+        if isinstance(value, (list, np.ndarray, array.array)):
+            schema = {"type": "array", "title": title or "Array"}
+            if isinstance(value, np.ndarray):
+                items = {"type": _dtype_to_json(value.dtype)}
+                for _ in range(value.ndim - 1):
+                    items = {"type": "array", "items": items}
+                schema["items"] = items
+            elif isinstance(value, array.array):
+                item_type = _ARRAY_TYPECODE_TO_JSON.get(value.typecode, "integer")
+                schema["items"] = {"type": item_type}
+            else:
+                stack.append(("enter", value, schema))
+            return schema
 
-        for key, value in obj.items():
-            schema["properties"][key] = self._value_to_schema(value, key)
+        schema = {"type": _py_type_to_json(py_type)}
+        if title:
+            schema["title"] = title
 
         return schema
 
-    def _list_to_schema(self, obj: list, title: Optional[str] = None) -> Dict:
-        """Generate schema from a list.
+    def _fill_list_schema(self, obj: list, schema: Dict, stack: List[tuple]) -> None:
+        """Set the item schema of a (non-empty) list.
+
+        The item schema is inferred from list_sample_size (evenly spaced)
+        items. Differing item schemas are combined with anyOf, once they are
+        complete (see _merge_item_schemas).
 
         Args:
             obj: List object
-            title: Optional title
-
-        Returns:
-            JSON Schema dict
+            schema: Schema of obj, to fill
+            stack: Work stack of object_to_schema
         """
-        schema = {
-            "type": "array",
-            "title": title or "Array",
-        }
+        if self.list_sample_size <= 1:
+            stack.append(("exit", obj, None))
+            schema["items"] = self._schema_shell(obj[0], None, stack)
+            return
+
+        sample = obj[:: max(1, len(obj) // self.list_sample_size)]
+        item_type = type(sample[0])
+        if item_type in _PRIMITIVE_TYPES and all(
+            type(item) is item_type for item in sample
+        ):
+            # Homogeneous primitives: no need for per-item schemas
+            schema["items"] = {"type": _PY_TO_JSON_TYPE[item_type]}
+            stack.append(("exit", obj, None))
+            return
+        item_schemas: List[Dict] = []
+        stack.append(("exit", obj, (schema, item_schemas)))
+        for item in sample:
+            item_schemas.append(self._schema_shell(item, None, stack))
 
-        # Try to infer item schema from first element
-        if obj:
-            schema["items"] = self._value_to_schema(obj[0])
-
-        return schema
-
-    def _value_to_schema(self, value: Any, title: Optional[str] = None) -> Dict:
-        """Generate schema from a single value.
+    @staticmethod
+    def _merge_item_schemas(schema: Dict, sampled: List[Dict]) -> None:
+        """Set a list's item schema from the (complete) schemas of its sample.
 
         Args:
-            value: Value to generate schema for
-            title: Optional title
-
-        Returns:
-            JSON Schema dict
+            schema: Schema of the list, to fill
+            sampled: Schemas of its sampled items
         """
-        py_type = type(value)
-        json_type = self.python_type_to_json_type(py_type)
-
-        schema = {"type": json_type}
-        if title:
-            schema["title"] = title
-
-        # For nested objects
-        if isinstance(value, dict):
-            return self._dict_to_schema(value, title)
-        elif isinstance(value, list):
-            return self._list_to_schema(value, title)
-
-        return schema
+        item_schemas: List[Dict] = []
+        for item_schema in sampled:
+            if item_schema not in item_schemas:
+                item_schemas.append(item_schema)
+        if len(item_schemas) == 1:
+            schema["items"] = item_schemas[0]
+        else:
+            schema["items"] = {"anyOf": item_schemas}
 
     def dag_config_schema(self) -> Dict:
         """Generate schema for DAG configuration.
 
+        The schema is static: this returns the shared module-level constant,
+        which callers must not mutate.
+
         Returns:
             JSON Schema for DAG configuration
         """
-        return {
-            "type": "object",
-            "title": "DAG Configuration",
-            "properties": {
-                "name": {
-                    "type": "string",
-                    "title": "DAG Name",
-                    "description": "Name of the DAG",
-                },
-                "nodes": {
-                    "type": "array",
-                    "title": "Nodes",
-                    "description": "Function nodes in the DAG",
-                    "items": {
-                        "type": "object",
-                        "properties": {
-                            "id": {"type": "string"},
-                            "function": {"type": "string"},
-                            "params": {"type": "object"},
-                        },
-                        "required": ["id", "function"],
-                    },
-                },
-                "edges": {
-                    "type": "array",
-                    "title": "Edges",
-                    "description": "Connections between nodes",
-                    "items": {
-                        "type": "object",
-                        "properties": {
-                            "source": {"type": "string"},
-                            "target": {"type": "string"},
-                            "sourceOutput": {"type": "string"},
-                            "targetInput": {"type": "string"},
-                        },
-                        "required": ["source", "target"],
-                    },
-                },
-            },
-            "required": ["name", "nodes"],
-        }
+        return _DAG_CONFIG_SCHEMA
+
 
+@cache
+def _get_schema_generator() -> SchemaGenerator:
+    """Get the global schema generator, created on first use."""
+    return SchemaGenerator()
 
-# Create a global schema generator instance
-_schema_generator = SchemaGenerator()
+
+# Schemas per function object (then per title). Weak, so functions dropped
+# from the registry aren't kept alive by their cached schemas.
+_FUNC_SCHEMA_CACHE: "WeakKeyDictionary[Callable, Dict[Optional[str], Dict]]" = (
+    WeakKeyDictionary()
+)
 
 
 def func_to_schema(func: Callable, title: Optional[str] = None) -> Dict:
     """Generate JSON Schema from a function.
 
+    Schemas are cached per (function, title); the returned dict is shared
+    and must not be mutated.
+
     Args:
         func: Function to generate schema for
         title: Optional title
@@ -268,7 +375,18 @@ def func_to_schema(func: Callable, title: Optional[str] = None) -> Dict:
     Returns:
         JSON Schema dict
     """
-    return _schema_generator.function_to_schema(func, title)
+    try:
+        schemas = _FUNC_SCHEMA_CACHE.get(func)
+        if schemas is None:
+            schemas = _FUNC_SCHEMA_CACHE[func] = {}
+    except TypeError:  # not weak-referenceable or not hashable
+        return _get_schema_generator().function_to_schema(func, title)
+    schema = schemas.get(title)
+    if schema is None:
+        schema = schemas[title] = _get_schema_generator().function_to_schema(
+            func, title
+        )
+    return schema
 
 
 def object_to_schema(obj: Any, title: Optional[str] = None) -> Dict:
@@ -281,13 +399,22 @@ def object_to_schema(obj: Any, title: Optional[str] = None) -> Dict:
     Returns:
         JSON Schema dict
     """
-    return _schema_generator.object_to_schema(obj, title)
+    return _get_schema_generator().object_to_schema(obj, title)
 
 
 def get_dag_config_schema() -> Dict:
     """Get the JSON Schema for DAG configuration.
 
     Returns:
-        JSON Schema dict
+        JSON Schema dict (shared; do not mutate)
+    """
+    return _get_schema_generator().dag_config_schema()
+
+
+def get_dag_config_schema_json() -> bytes:
+    """Get the JSON Schema for DAG configuration, encoded once as JSON.
+
+    Returns:
+        JSON bytes of the schema
     """
-    return _schema_generator.dag_config_schema()
+    return _DAG_CONFIG_SCHEMA_JSON
@@ -6,8 +6,21 @@ This module provides:
 - Time-series data access
 """
 
-from typing import Any, Dict, List, Optional, Union, Iterable
+from typing import (
+    Any,
+    Dict,
+    List,
+    Literal,
+    Optional,
+    Union,
+    Iterable,
+    Iterator,
+    Tuple,
+)
+from collections import OrderedDict
+from functools import cache
 from pathlib import Path
+import base64
 import numpy as np
 
 try:
@@ -68,6 +81,8 @@ class FileStreamSource(StreamSource):
         source_id: str,
         file_path: Union[str, Path],
         sample_rate: float = 1.0,
+        *,
+        mmap: bool = True,
     ):
         """Initialize file-based stream source.
 
@@ -75,14 +90,27 @@ class FileStreamSource(StreamSource):
             source_id: Unique identifier
             file_path: Path to data file
             sample_rate: Samples per second
+            mmap: If True, memory-map .npy files instead of reading them
+                into memory
         """
         super().__init__(source_id, sample_rate)
         self.file_path = Path(file_path)
+        self.mmap = mmap
         self._data = None
+        self._shape: Optional[Tuple[int, ...]] = None
+        self._sr = float(sample_rate)
+        self._inv_sr = 1.0 / self._sr
+        self._n: Optional[int] = None  # length in samples, once known
+        self._duration: Optional[float] = None  # length in seconds, once known
 
     def _load_data(self) -> np.ndarray:
         """Load data from file.
 
+        ``.npy`` files are memory-mapped read-only (unless ``mmap=False``):
+        slicing only pages in the blocks it touches, so a short slice of a
+        long recording never reads the whole file. Other formats would need a
+        chunked reader (e.g. a creek-backed one) to get the same property.
+
         Returns:
             Loaded data array
         """
@@ -90,34 +118,104 @@ class FileStreamSource(StreamSource):
             # Placeholder - implement actual file loading
             # Could use creek readers here
             if self.file_path.suffix == ".npy":
-                self._data = np.load(self.file_path)
+                # Memory-map so slices only page in the bytes they touch
+                # (asarray: a plain ndarray view, which orjson can encode)
+                mmap_mode = "r" if self.mmap else None
+                self._data = np.asarray(np.load(self.file_path, mmap_mode=mmap_mode))
             else:
                 # Fallback to dummy data
                 self._data = np.random.randn(1000)
         return self._data
 
+    def _header_shape(self) -> Tuple[int, ...]:
+        """Get the shape of the data, from the .npy header when possible.
+
+        Reading the header avoids touching (or mapping) the array payload.
+
+        Returns:
+            Shape of the data array
+        """
+        if self._shape is None:
+            if self._data is None and self.file_path.suffix == ".npy":
+                with open(self.file_path, "rb") as f:
+                    version = np.lib.format.read_magic(f)
+                    if version == (1, 0):
+                        shape, _, _ = np.lib.format.read_array_header_1_0(f)
+                    elif version == (2, 0):
+                        shape, _, _ = np.lib.format.read_array_header_2_0(f)
+                    else:
+                        shape = None
+                self._shape = shape if shape is not None else self._load_data().shape
+            else:
+                self._shape = self._load_data().shape
+        return self._shape
+
+    def _length(self) -> int:
+        """Get the length of the stream in samples (computed once).
+
+        Returns:
+            Number of samples
+        """
+        if self._n is None:
+            self._n = self._header_shape()[0]
+            self._duration = self._n * self._inv_sr
+        return self._n
+
+    def read(
+        self, bt: float = 0, tt: Optional[float] = None, *, writable: bool = False
+    ) -> np.ndarray:
+        """Read the samples between two times.
+
+        Args:
+            bt: Bottom time (start) in seconds
+            tt: Top time (end) in seconds (None = end of stream)
+            writable: If True, return a private, writable copy; otherwise a
+                (possibly read-only, memory-mapped) view of the data
+
+        Returns:
+            Data for the requested range (clamped to the stream's extent)
+        """
+        # Convert time to samples (negative indices would wrap around)
+        n = self._length()
+        bt_idx = max(int(bt * self._sr), 0) if bt else 0
+        tt_idx = n if tt is None else min(max(int(tt * self._sr), 0), n)
+
+        return self.read_samples(bt_idx, tt_idx, writable=writable)
+
+    def read_samples(
+        self, start: int, stop: int, *, writable: bool = False
+    ) -> np.ndarray:
+        """Read the samples in the index range [start:stop].
+
+        Args:
+            start: First sample index
+            stop: Sample index to stop before
+            writable: If True, return a private, writable copy; otherwise a
+                (possibly read-only, memory-mapped) view of the data
+
+        Returns:
+            Data for the requested range
+        """
+        view = self._load_data()[start:stop]
+        return view.copy() if writable else view
+
     def __getitem__(self, key: Union[slice, int]) -> np.ndarray:
         """Get data by time slice or index.
 
+        Slices are views of the (memory-mapped) data; use ``read(...,
+        writable=True)`` to get an array you can modify.
+
         Args:
             key: Slice (time range in seconds) or int (sample index)
 
         Returns:
             Data for the requested range
         """
-        data = self._load_data()
-
         if isinstance(key, slice):
-            # Convert time to samples
             bt = key.start if key.start is not None else 0
-            tt = key.stop if key.stop is not None else len(data) / self.sample_rate
-
-            bt_idx = int(bt * self.sample_rate)
-            tt_idx = int(tt * self.sample_rate)
-
-            return data[bt_idx:tt_idx]
+            return self.read(bt, key.stop)
         else:
-            return data[key]
+            return self._load_data()[key]
 
     def get_metadata(self) -> Dict[str, Any]:
         """Get metadata including file info.
@@ -126,23 +224,32 @@ class FileStreamSource(StreamSource):
             Stream metadata
         """
         metadata = super().get_metadata()
-        data = self._load_data()
+        length_samples = self._length()
 
         metadata.update({
             "file_path": str(self.file_path),
-            "length_samples": len(data),
-            "length_seconds": len(data) / self.sample_rate,
+            "length_samples": length_samples,
+            "length_seconds": self._duration,
         })
 
         return metadata
 
 
+SliceFormat = Literal["list", "b64", "raw"]
+
+
 class StreamRegistry:
     """Registry for managing multiple stream sources."""
 
-    def __init__(self):
-        """Initialize the stream registry."""
+    def __init__(self, list_cache_size: int = 16):
+        """Initialize the stream registry.
+
+        Args:
+            list_cache_size: Maximum number of list-format slices to keep
+        """
         self._streams: Dict[str, StreamSource] = {}
+        self.list_cache_size = list_cache_size
+        self._list_cache: OrderedDict[Tuple[str, float, float], List] = OrderedDict()
 
     def register(self, stream: StreamSource) -> None:
         """Register a stream source.
@@ -151,6 +258,7 @@ class StreamRegistry:
             stream: Stream source to register
         """
         self._streams[stream.source_id] = stream
+        self._list_cache.clear()
 
     def get(self, source_id: str) -> StreamSource:
         """Get a stream by ID.
@@ -164,17 +272,22 @@ class StreamRegistry:
         Raises:
             KeyError: If stream not found
         """
-        if source_id not in self._streams:
-            raise KeyError(f"Stream '{source_id}' not found")
-        return self._streams[source_id]
+        try:
+            return self._streams[source_id]
+        except KeyError:
+            raise KeyError(f"Stream '{source_id}' not found") from None
+
+    def __contains__(self, source_id: str) -> bool:
+        """Check whether a stream is registered under source_id."""
+        return source_id in self._streams
 
-    def list_streams(self) -> List[str]:
+    def list_streams(self) -> Tuple[str, ...]:
         """List all registered stream IDs.
 
         Returns:
-            List of stream IDs
+            Tuple of stream IDs
         """
-        return list(self._streams.keys())
+        return tuple(self._streams)
 
     def get_all_metadata(self) -> Dict[str, Dict]:
         """Get metadata for all streams.
@@ -187,8 +300,33 @@ class StreamRegistry:
             for stream_id, stream in self._streams.items()
         }
 
+    def _slice_as_list(
+        self, source_id: str, bt: float, tt: float, data: np.ndarray
+    ) -> List:
+        """Convert a slice to a list, reusing the result for repeated windows.
+
+        Args:
+            source_id: Stream identifier
+            bt: Bottom time (start) in seconds
+            tt: Top time (end) in seconds
+            data: The sliced samples
+
+        Returns:
+            Samples as a (shared, not to be mutated) list
+        """
+        key = (source_id, bt, tt)
+        values = self._list_cache.get(key)
+        if values is not None:
+            self._list_cache.move_to_end(key)
+            return values
+
+        values = self._list_cache[key] = data.tolist()
+        if len(self._list_cache) > self.list_cache_size:
+            self._list_cache.popitem(last=False)
+        return values
+
     def slice_stream(
-        self, source_id: str, bt: float, tt: float
+        self, source_id: str, bt: float, tt: float, *, format: SliceFormat = "list"
     ) -> Dict[str, Any]:
         """Slice a stream by time range.
 
@@ -196,6 +334,12 @@ class StreamRegistry:
             source_id: Stream identifier
             bt: Bottom time (start) in seconds
             tt: Top time (end) in seconds
+            format: How to return the samples:
+                - "list": a Python list (cached per (source_id, bt, tt))
+                - "b64": base64 of the little-endian float32 bytes, with a
+                  "dtype" field
+                - "raw": the numpy array itself (e.g. for orjson, which
+                  encodes arrays without a per-sample Python object)
 
         Returns:
             Dictionary with sliced data and metadata
@@ -203,14 +347,131 @@ class StreamRegistry:
         stream = self.get(source_id)
         data = stream[bt:tt]
 
-        return {
+        result = {
             "source_id": source_id,
             "bt": bt,
             "tt": tt,
-            "data": data.tolist(),  # Convert to list for JSON serialization
             "shape": data.shape,
             "sample_rate": stream.sample_rate,
         }
+        if format == "list":
+            result["data"] = self._slice_as_list(source_id, bt, tt, data)
+        else:
+            _set_data(result, data, format)
+        return result
+
+    def _channel_slices(
+        self, channel_ids: Iterable[str], bt: float, tt: float
+    ) -> Tuple[Dict[str, np.ndarray], Dict[str, float], Dict[str, str]]:
+        """Slice several streams over the same time range.
+
+        Sample indices are computed once per distinct sample rate, and
+        streams that can be read by sample index (``read_samples``) are read
+        with them directly, bypassing the time-based ``__getitem__``.
+
+        Args:
+            channel_ids: Stream/channel IDs
+            bt: Bottom time (start) in seconds
+            tt: Top time (end) in seconds
+
+        Returns:
+            Tuple of ({channel_id: samples}, {channel_id: sample rate},
+            {channel_id: error message}), in channel_ids order
+        """
+        arrays: Dict[str, np.ndarray] = {}
+        sample_rates: Dict[str, float] = {}
+        errors: Dict[str, str] = {}
+        index_ranges: Dict[float, Tuple[int, int]] = {}
+        for channel_id in channel_ids:
+            stream = self._streams.get(channel_id)
+            if stream is None:
+                errors[channel_id] = str(KeyError(f"Stream '{channel_id}' not found"))
+                continue
+            rate = sample_rates[channel_id] = stream.sample_rate
+            read_samples = getattr(stream, "read_samples", None)
+            if read_samples is None:
+                arrays[channel_id] = stream[bt:tt]
+                continue
+            index_range = index_ranges.get(rate)
+            if index_range is None:
+                # Clamped at 0, since negative indices would wrap around
+                index_range = index_ranges[rate] = (
+                    max(int(bt * rate), 0),
+                    max(int(tt * rate), 0),
+                )
+            arrays[channel_id] = read_samples(*index_range)
+        return arrays, sample_rates, errors
+
+    def slice_streams(
+        self,
+        channel_ids: Iterable[str],
+        bt: float,
+        tt: float,
+        *,
+        format: SliceFormat = "raw",
+    ) -> Dict[str, Any]:
+        """Slice several streams into a single block of samples.
+
+        When all channels have the same sample rate and length, "data" is a
+        (n_channels, n_samples) array; otherwise the channels are
+        concatenated and "lengths" tells where to split.
+
+        Args:
+            channel_ids: Stream/channel IDs
+            bt: Bottom time (start) in seconds
+            tt: Top time (end) in seconds
+            format: Sample format (see slice_stream; "list" is not cached)
+
+        Returns:
+            Dictionary with "channels" (IDs, in order), "sample_rates",
+            "lengths", "stacked", "shape", "data" and "errors" (messages for
+            unknown channels, which are left out)
+        """
+        arrays, rates, errors = self._channel_slices(channel_ids, bt, tt)
+        ids = list(arrays)
+        sample_rates = list(rates.values())
+        lengths = [len(a) for a in arrays.values()]
+
+        stacked = len(set(sample_rates)) <= 1 and len(set(lengths)) <= 1
+        if not ids:
+            data = np.empty((0, 0), dtype=np.float32)
+        elif stacked:
+            data = np.stack(list(arrays.values()))
+        else:
+            data = np.concatenate([np.ravel(a) for a in arrays.values()])
+
+        result = {
+            "bt": bt,
+            "tt": tt,
+            "channels": ids,
+            "sample_rates": sample_rates,
+            "lengths": lengths,
+            "stacked": stacked,
+            "shape": data.shape,
+            "errors": errors,
+        }
+        _set_data(result, data, format)
+        return result
+
+
+def _set_data(result: Dict[str, Any], data: np.ndarray, format: SliceFormat) -> None:
+    """Store samples in a slice result, encoded according to format.
+
+    Args:
+        result: Slice result dict to update
+        data: Samples
+        format: "list", "b64" or "raw" (see StreamRegistry.slice_stream)
+    """
+    if format == "list":
+        result["data"] = data.tolist()
+    elif format == "b64":
+        raw = np.asarray(data).astype("<f4", copy=False).tobytes()
+        result["data"] = base64.b64encode(raw).decode("ascii")
+        result["dtype"] = "float32"
+    elif format == "raw":
+        result["data"] = data
+    else:
+        raise ValueError(f"Unknown slice format: {format!r}")
 
 
 class MultiChannelView:
@@ -228,32 +489,105 @@ class MultiChannelView:
         self.registry = registry
 
     def get_synchronized_slice(
-        self, channel_ids: List[str], bt: float, tt: float
+        self,
+        channel_ids: List[str],
+        bt: float,
+        tt: float,
+        *,
+        format: SliceFormat = "list",
     ) -> Dict[str, Any]:
         """Get synchronized data from multiple channels.
 
+        All channels are sliced in one batch (see get_stacked_slice for a
+        single-block variant).
+
         Args:
             channel_ids: List of stream/channel IDs
             bt: Bottom time (start) in seconds
             tt: Top time (end) in seconds
+            format: Sample format (see StreamRegistry.slice_stream)
 
         Returns:
             Dictionary with synchronized multi-channel data
         """
-        result = {
-            "bt": bt,
-            "tt": tt,
-            "channels": {},
-        }
+        arrays, sample_rates, errors = self.registry._channel_slices(
+            channel_ids, bt, tt
+        )
+        channels = {}
+        for channel_id in channel_ids:
+            data = arrays.get(channel_id)
+            if data is None:
+                channels[channel_id] = {"error": errors[channel_id]}
+                continue
+            channels[channel_id] = channel_data = {
+                "source_id": channel_id,
+                "bt": bt,
+                "tt": tt,
+                "shape": data.shape,
+                "sample_rate": sample_rates[channel_id],
+            }
+            _set_data(channel_data, data, format)
+
+        return {"bt": bt, "tt": tt, "channels": channels}
+
+    def get_stacked_slice(
+        self,
+        channel_ids: List[str],
+        bt: float,
+        tt: float,
+        *,
+        format: SliceFormat = "raw",
+    ) -> Dict[str, Any]:
+        """Get synchronized slices as one (n_channels, n_samples) block.
+
+        Column-oriented counterpart of get_synchronized_slice: channel
+        metadata are parallel lists and, when channels share a sample rate
+        and length, ``data[i]`` holds the samples of ``channels[i]``.
+
+        Args:
+            channel_ids: List of stream/channel IDs
+            bt: Bottom time (start) in seconds
+            tt: Top time (end) in seconds
+            format: Sample format (see StreamRegistry.slice_stream)
+
+        Returns:
+            Dictionary as returned by StreamRegistry.slice_streams
+        """
+        return self.registry.slice_streams(channel_ids, bt, tt, format=format)
 
+    def iter_channel_slices(
+        self,
+        channel_ids: List[str],
+        bt: float,
+        tt: float,
+        *,
+        format: SliceFormat = "raw",
+    ) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """Lazily slice multiple channels, one at a time.
+
+        Unlike get_synchronized_slice, only one channel's data is held at a
+        time, and sample data is kept as numpy arrays by default.
+
+        Args:
+            channel_ids: List of stream/channel IDs
+            bt: Bottom time (start) in seconds
+            tt: Top time (end) in seconds
+            format: Sample format (see StreamRegistry.slice_stream)
+
+        Yields:
+            (channel_id, channel_data) pairs, in channel_ids order. A channel
+            that can't be sliced (unknown, or failing to read) yields
+            ``{"error": message}`` instead, so a streamed response stays
+            valid JSON.
+        """
         for channel_id in channel_ids:
             try:
-                channel_data = self.registry.slice_stream(channel_id, bt, tt)
-                result["channels"][channel_id] = channel_data
-            except KeyError as e:
-                result["channels"][channel_id] = {"error": str(e)}
-
-        return result
+                channel_data = self.registry.slice_stream(
+                    channel_id, bt, tt, format=format
+                )
+            except Exception as e:
+                channel_data = {"error": str(e)}
+            yield channel_id, channel_data
 
     def get_channel_info(self, channel_ids: List[str]) -> Dict[str, Dict]:
         """Get metadata for multiple channels.
@@ -267,18 +601,17 @@ class MultiChannelView:
         return {
             channel_id: self.registry.get(channel_id).get_metadata()
             for channel_id in channel_ids
-            if channel_id in self.registry.list_streams()
+            if channel_id in self.registry
         }
 
 
-# Global stream registry
-_global_stream_registry = StreamRegistry()
-
-
+@cache
 def get_stream_registry() -> StreamRegistry:
     """Get the global stream registry.
 
+    The registry is created on first use, not on import.
+
     Returns:
         Global StreamRegistry instance
     """
-    return _global_stream_registry
+    return StreamRegistry()
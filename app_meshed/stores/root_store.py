@@ -8,20 +8,344 @@ to different data sources:
 - configs: Application configurations
 """
 
-from typing import Any, Mapping
+from typing import Any, Iterator, Mapping, MutableMapping
 from pathlib import Path
+import builtins
+import importlib
+import importlib.util
 import json
+import marshal
+import os
 import pickle
-from functools import partial
+import time
+import types
+from functools import lru_cache, partial
 
 try:
-    from dol import Pipe, Store, wrap_kvs, filt_iter, cached_keys
-    from dol.sources import Files
+    from dol import Files, Pipe, Store, wrap_kvs, filt_iter, cached_keys
 except ImportError:
     raise ImportError(
         "dol is required. Install with: pip install dol"
     )
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import cloudpickle
+except ImportError:
+    # Optional: without it, functions that can't be marshalled are pickled
+    cloudpickle = None
+
+
+@lru_cache(maxsize=None)
+def _ensure_dir(path: str) -> None:
+    """Create a directory (and parents) once per process.
+
+    Args:
+        path: Absolute directory path
+    """
+    if not os.path.isdir(path):
+        os.makedirs(path, exist_ok=True)
+
+
+# Key and value codecs for the sub-stores. Module-level functions, shared by
+# all stores, rather than per-store lambdas.
+
+
+def _add_pkl_ext(k: str) -> str:
+    return k if k.endswith(".pkl") else f"{k}.pkl"
+
+
+def _strip_pkl_ext(k: str) -> str:
+    return k.removesuffix(".pkl")
+
+
+def _add_json_ext(k: str) -> str:
+    return k if k.endswith(".json") else f"{k}.json"
+
+
+def _strip_json_ext(k: str) -> str:
+    return k.removesuffix(".json")
+
+
+if orjson is not None:
+    _JSON_ENCODE_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+
+    _json_decode = orjson.loads  # accepts bytes and str
+
+    def _json_encode(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=_JSON_ENCODE_OPTIONS)
+
+else:
+
+    def _json_decode(data: Any) -> Any:
+        return json.loads(data.decode() if isinstance(data, bytes) else data)
+
+    def _json_encode(obj: Any) -> bytes:
+        return json.dumps(obj, indent=2).encode()
+
+
+_pickle_loads = pickle.loads
+_pickle_dumps = pickle.dumps
+
+
+# Function codec. Serialized functions start with a one-byte format tag:
+# b"M": marshal of the code object (plain functions without closures),
+# b"C": cloudpickle, b"P": pickle. Untagged data is legacy plain pickle.
+# Marshal data is only readable by the Python version that wrote it, so the
+# "M" tag is followed by that version's bytecode magic number and by the
+# function's "module:qualname" reference (2-byte length, then utf-8), used to
+# import the function instead when the versions differ.
+_MARSHAL_TAG = b"M"
+_CLOUDPICKLE_TAG = b"C"
+_PICKLE_TAG = b"P"
+
+
+def _marshal_fn(func: Any) -> bytes:
+    """Marshal a plain function, or raise ValueError if it can't be done losslessly.
+
+    The function's globals are restored by importing its module on load, and
+    annotations must be builtin types (stored by name) or strings.
+    """
+    if not isinstance(func, types.FunctionType) or func.__closure__:
+        raise ValueError("Not a plain function without closure")
+    if func.__module__ in (None, "__main__"):
+        raise ValueError("Function module can't be imported on load")
+    annotations = {}
+    for name, ann in func.__annotations__.items():
+        if isinstance(ann, type) and getattr(builtins, ann.__name__, None) is ann:
+            annotations[name] = ("builtin", ann.__name__)
+        elif isinstance(ann, str):
+            annotations[name] = ("str", ann)
+        else:
+            raise ValueError(f"Annotation of {name} can't be marshalled")
+    return marshal.dumps(
+        (
+            func.__code__,
+            func.__name__,
+            func.__qualname__,
+            func.__module__,
+            func.__doc__,
+            func.__defaults__,
+            func.__kwdefaults__,
+            annotations,
+        )
+    )
+
+
+def _unmarshal_fn(data: bytes) -> types.FunctionType:
+    """Rebuild a function serialized by _marshal_fn."""
+    code, name, qualname, module, doc, defaults, kwdefaults, annotations = (
+        marshal.loads(data)
+    )
+    func = types.FunctionType(
+        code, vars(importlib.import_module(module)), name, defaults
+    )
+    func.__qualname__ = qualname
+    func.__module__ = module
+    func.__doc__ = doc
+    func.__kwdefaults__ = kwdefaults
+    func.__annotations__ = {
+        k: getattr(builtins, v) if kind == "builtin" else v
+        for k, (kind, v) in annotations.items()
+    }
+    return func
+
+
+def _marshal_header(func: types.FunctionType) -> bytes:
+    ref = f"{func.__module__}:{func.__qualname__}".encode()
+    return (
+        _MARSHAL_TAG + importlib.util.MAGIC_NUMBER + len(ref).to_bytes(2, "big") + ref
+    )
+
+
+def _import_fn(ref: str) -> Any:
+    """Load a function by its "module:qualname" reference."""
+    module, qualname = ref.split(":", 1)
+    obj = importlib.import_module(module)
+    for attr in qualname.split("."):
+        obj = getattr(obj, attr)
+    return obj
+
+
+def _serialize_fn(func: Any) -> bytes:
+    try:
+        data = _marshal_fn(func)
+    except ValueError:  # also raised by marshal for unsupported values
+        pass
+    else:
+        return _marshal_header(func) + data
+    if cloudpickle is not None:
+        return _CLOUDPICKLE_TAG + cloudpickle.dumps(func)
+    return _PICKLE_TAG + pickle.dumps(func)
+
+
+def _deserialize_fn(data: bytes) -> Any:
+    tag, payload = data[:1], data[1:]
+    if tag == _MARSHAL_TAG:
+        magic, payload = payload[:4], payload[4:]
+        ref_len = int.from_bytes(payload[:2], "big")
+        ref, payload = payload[2 : 2 + ref_len].decode(), payload[2 + ref_len :]
+        if magic == importlib.util.MAGIC_NUMBER:
+            return _unmarshal_fn(payload)
+        try:
+            return _import_fn(ref)
+        except (ImportError, AttributeError, ValueError) as e:
+            raise ValueError(
+                f"Function {ref} was saved by another Python version "
+                f"(bytecode magic {magic!r}, this one is "
+                f"{importlib.util.MAGIC_NUMBER!r}) and can't be imported: {e}"
+            ) from e
+    elif tag in (_CLOUDPICKLE_TAG, _PICKLE_TAG):
+        # cloudpickle output is loaded by plain pickle
+        return pickle.loads(payload)
+    return pickle.loads(data)
+
+
+@lru_cache(maxsize=256)
+def _load_function_file(path: str, mtime_ns: int, size: int) -> Any:
+    """Load a serialized function file (cached per path, mtime and size).
+
+    The size guards against rewrites within one tick of a coarse timestamp.
+    """
+    with open(path, "rb") as f:
+        return _deserialize_fn(f.read())
+
+
+class FunctionFiles(MutableMapping):
+    """Store of functions saved as ``<key>.pkl`` files (see _serialize_fn).
+
+    Reads stat the file and reuse the previously loaded function until the
+    file's modification time or size changes, skipping both the read and the
+    deserialization.
+    """
+
+    def __init__(self, rootdir: str):
+        """Initialize the store.
+
+        Args:
+            rootdir: Directory holding the function files
+        """
+        self.rootdir = os.path.abspath(rootdir)
+        self._store = wrap_kvs(
+            Files(self.rootdir),
+            key_of_id=_strip_pkl_ext,
+            id_of_key=_add_pkl_ext,
+            obj_of_data=_deserialize_fn,
+            data_of_obj=_serialize_fn,
+        )
+
+    def __getitem__(self, k: str) -> Any:
+        path = os.path.normpath(os.path.join(self.rootdir, _add_pkl_ext(k)))
+        if os.path.dirname(path) != self.rootdir:
+            raise KeyError(k)
+        try:
+            stat = os.stat(path)
+        except (FileNotFoundError, NotADirectoryError):
+            raise KeyError(k)
+        return _load_function_file(path, stat.st_mtime_ns, stat.st_size)
+
+    def __setitem__(self, k: str, v: Any) -> None:
+        self._store[k] = v
+
+    def __delitem__(self, k: str) -> None:
+        del self._store[k]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._store)
+
+    def __len__(self) -> int:
+        return len(self._store)
+
+
+# Directories modified this close to when a listing started may have changed
+# during the listing within one tick of a coarse filesystem timestamp, so such
+# listings are not trusted past the next access.
+_MTIME_SLACK_NS = 2_000_000_000
+
+
+class DirCachedKeys(MutableMapping):
+    """Store wrapper caching the keys of a directory-backed store.
+
+    Keys are cached with dol's ``cached_keys``. Writes and deletes drop the
+    cache, and so does a change of the modification time of the directory, or
+    of a subdirectory holding keys, so that files written by other processes
+    (or directly) are picked up. Checking costs a stat per such directory.
+    Subdirectories that held no keys when listed are not watched: files
+    added to them show up on the next change to a watched directory, or
+    after invalidate().
+    """
+
+    def __init__(self, store: MutableMapping, rootdir: str):
+        """Initialize the wrapper.
+
+        Args:
+            store: The store to wrap (whose keys are files under rootdir)
+            rootdir: Directory holding the store's files
+        """
+        self.store = store
+        self.rootdir = os.path.abspath(rootdir)
+        self._cached = cached_keys(store, keys_cache=set)
+        # (directories, their mtimes) when the cached keys were listed
+        self._stamp: tuple[tuple[str, ...], tuple[int, ...]] | None = None
+
+    def _dir_mtimes(self, dirs: tuple[str, ...]) -> tuple[int, ...] | None:
+        try:
+            return tuple(os.stat(d).st_mtime_ns for d in dirs)
+        except FileNotFoundError:  # a subdirectory was removed
+            return None
+
+    def _keys(self) -> set:
+        if self._stamp is not None:
+            dirs, mtimes = self._stamp
+            if self._dir_mtimes(dirs) == mtimes:
+                return self._cached._keys_cache
+        self.invalidate()
+        started = time.time_ns()
+        keys = self._cached._keys_cache = set(self._cached)
+        subdirs = set()
+        for k in keys:
+            d = os.path.dirname(k)
+            while d and d not in subdirs:
+                subdirs.add(d)
+                d = os.path.dirname(d)
+        dirs = (self.rootdir, *(os.path.join(self.rootdir, d) for d in subdirs))
+        mtimes = self._dir_mtimes(dirs)
+        if mtimes is not None and max(mtimes) < started - _MTIME_SLACK_NS:
+            self._stamp = dirs, mtimes
+        return keys
+
+    def invalidate(self) -> None:
+        """Drop the cached keys; the next listing re-reads the directory."""
+        try:
+            del self._cached._keys_cache
+        except AttributeError:
+            pass
+        self._stamp = None
+
+    def __getitem__(self, k: str) -> Any:
+        return self.store[k]
+
+    def __setitem__(self, k: str, v: Any) -> None:
+        self.store[k] = v
+        self.invalidate()
+
+    def __delitem__(self, k: str) -> None:
+        del self.store[k]
+        self.invalidate()
+
+    def __contains__(self, k: object) -> bool:
+        return k in self._keys()
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(tuple(self._keys()))
+
+    def __len__(self) -> int:
+        return len(self._keys())
+
 
 class RootStore:
     """Root store that provides access to all sub-stores.
@@ -45,16 +369,33 @@ class RootStore:
         self.base_path = Path(base_path)
         self._ensure_directories()
 
-        # Initialize sub-stores
-        self.raw_data = self._create_raw_data_store()
-        self.functions = self._create_functions_store()
-        self.meshes = self._create_meshes_store()
-        self.configs = self._create_configs_store()
+        # Initialize sub-stores. Their keys are cached until their directory
+        # changes (see DirCachedKeys), so several processes can share them.
+        self.raw_data = self._cache_keys(self._create_raw_data_store(), "raw_data")
+        self.functions = self._cache_keys(self._create_functions_store(), "functions")
+        self.meshes = self._cache_keys(self._create_meshes_store(), "meshes")
+        self.configs = self._cache_keys(self._create_configs_store(), "configs")
+
+    def _cache_keys(self, store: MutableMapping, subdir: str) -> DirCachedKeys:
+        return DirCachedKeys(store, str(self.base_path / subdir))
+
+    def invalidate(self) -> None:
+        """Drop the cached keys of all sub-stores.
+
+        The next listing of each store re-reads its directory.
+        """
+        for store in (self.raw_data, self.functions, self.meshes, self.configs):
+            store.invalidate()
 
     def _ensure_directories(self):
-        """Create necessary directories if they don't exist."""
+        """Create necessary directories if they don't exist.
+
+        Each directory is checked (and created if needed) once per process,
+        however many RootStore instances point to it.
+        """
+        base_path = os.path.abspath(self.base_path)
         for subdir in ["raw_data", "functions", "meshes", "configs"]:
-            (self.base_path / subdir).mkdir(parents=True, exist_ok=True)
+            _ensure_dir(os.path.join(base_path, subdir))
 
     def _create_raw_data_store(self) -> Mapping:
         """Create a store for raw binary data (audio, sensors, etc.).
@@ -67,21 +408,32 @@ class RootStore:
     def _create_functions_store(self) -> Mapping:
         """Create a store for Python functions.
 
-        Functions are stored as pickled objects. For production use,
-        consider using dill or cloudpickle for better serialization.
+        Plain functions are stored as marshalled code objects; anything else
+        is serialized with cloudpickle (if installed) or pickle. Loaded
+        functions are cached until their file changes.
 
         Returns:
-            A dol store for functions with pickle codec
+            A store for functions
         """
-        base_store = Files(str(self.base_path / "functions"))
+        return FunctionFiles(str(self.base_path / "functions"))
+
+    def _create_json_store(self, subdir: str) -> Mapping:
+        """Create a store of JSON documents, saved as ``<key>.json`` files.
+
+        Args:
+            subdir: Directory (under base_path) holding the files
+
+        Returns:
+            A dol store with JSON codec
+        """
+        base_store = Files(str(self.base_path / subdir))
 
-        # Wrap with pickle codec for Python object serialization
         return wrap_kvs(
             base_store,
-            key_of_id=lambda k: k if k.endswith('.pkl') else f"{k}.pkl",
-            id_of_key=lambda k: k.replace('.pkl', ''),
-            obj_of_data=pickle.loads,
-            data_of_obj=pickle.dumps,
+            key_of_id=_strip_json_ext,
+            id_of_key=_add_json_ext,
+            obj_of_data=_json_decode,
+            data_of_obj=_json_encode,
         )
 
     def _create_meshes_store(self) -> Mapping:
@@ -92,16 +444,7 @@ class RootStore:
         Returns:
             A dol store for mesh configurations with JSON codec
         """
-        base_store = Files(str(self.base_path / "meshes"))
-
-        # Wrap with JSON codec
-        return wrap_kvs(
-            base_store,
-            key_of_id=lambda k: k if k.endswith('.json') else f"{k}.json",
-            id_of_key=lambda k: k.replace('.json', ''),
-            obj_of_data=lambda data: json.loads(data.decode() if isinstance(data, bytes) else data),
-            data_of_obj=lambda obj: json.dumps(obj, indent=2).encode(),
-        )
+        return self._create_json_store("meshes")
 
     def _create_configs_store(self) -> Mapping:
         """Create a store for application configurations.
@@ -109,28 +452,34 @@ class RootStore:
         Returns:
             A dol store for configs with JSON codec
         """
-        base_store = Files(str(self.base_path / "configs"))
-
-        return wrap_kvs(
-            base_store,
-            key_of_id=lambda k: k if k.endswith('.json') else f"{k}.json",
-            id_of_key=lambda k: k.replace('.json', ''),
-            obj_of_data=lambda data: json.loads(data.decode() if isinstance(data, bytes) else data),
-            data_of_obj=lambda obj: json.dumps(obj, indent=2).encode(),
-        )
+        return self._create_json_store("configs")
 
-    def list_all_keys(self) -> dict[str, list[str]]:
+    def list_all_keys(self) -> dict[str, tuple[str, ...]]:
         """List all keys across all sub-stores.
 
+        Keys come from the sub-stores' key caches, so no directory is listed
+        (until invalidate() is called).
+
         Returns:
-            Dictionary mapping store names to lists of keys
+            Dictionary mapping store names to tuples of keys
         """
-        return {
-            "raw_data": list(self.raw_data.keys()),
-            "functions": list(self.functions.keys()),
-            "meshes": list(self.meshes.keys()),
-            "configs": list(self.configs.keys()),
-        }
+        return dict(self.keys_snapshot())
+
+    def keys_snapshot(self) -> tuple[tuple[str, tuple[str, ...]], ...]:
+        """Snapshot the keys of all sub-stores as a hashable tuple.
+
+        Same content as list_all_keys, as ((store_name, keys), ...) tuples,
+        so it can key caches of data derived from the store contents.
+
+        Returns:
+            Tuple of (store name, tuple of keys) pairs
+        """
+        return (
+            ("raw_data", tuple(self.raw_data)),
+            ("functions", tuple(self.functions)),
+            ("meshes", tuple(self.meshes)),
+            ("configs", tuple(self.configs)),
+        )
 
     def get_store(self, store_name: str) -> Mapping:
         """Get a specific sub-store by name.
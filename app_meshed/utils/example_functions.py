@@ -4,6 +4,10 @@ These functions are automatically registered on startup and can be used
 to build DAGs in the Mesh Maker UI.
 """
 
+from typing import Callable, Dict
+
+import numpy as np
+
 
 def add(a: int, b: int) -> int:
     """Add two numbers.
@@ -140,12 +144,17 @@ def string_length(text: str) -> int:
 def list_sum(numbers: list) -> float:
     """Sum all numbers in a list.
 
+    Lists are summed with the builtin sum (converting them to an array costs
+    more than summing them); numpy arrays are reduced with numpy.
+
     Args:
-        numbers: List of numbers
+        numbers: List (or numpy array) of numbers
 
     Returns:
-        Sum of all numbers
+        Sum of all numbers (0 for an empty list)
     """
+    if isinstance(numbers, np.ndarray):
+        return numbers.sum().item()
     return sum(numbers)
 
 
@@ -153,7 +162,7 @@ def list_average(numbers: list) -> float:
     """Calculate the average of numbers in a list.
 
     Args:
-        numbers: List of numbers
+        numbers: List (or numpy array) of numbers
 
     Returns:
         Average value
@@ -161,23 +170,23 @@ def list_average(numbers: list) -> float:
     Raises:
         ValueError: If list is empty
     """
-    if not numbers:
+    if len(numbers) == 0:
         raise ValueError("Cannot calculate average of empty list")
-    return sum(numbers) / len(numbers)
-
-
-# List of all example functions
-EXAMPLE_FUNCTIONS = [
-    ("add", add),
-    ("multiply", multiply),
-    ("subtract", subtract),
-    ("divide", divide),
-    ("power", power),
-    ("absolute_value", absolute_value),
-    ("concatenate", concatenate),
-    ("to_uppercase", to_uppercase),
-    ("to_lowercase", to_lowercase),
-    ("string_length", string_length),
-    ("list_sum", list_sum),
-    ("list_average", list_average),
-]
+    return list_sum(numbers) / len(numbers)
+
+
+# All example functions, by registration name
+EXAMPLE_FUNCTIONS: Dict[str, Callable] = {
+    "add": add,
+    "multiply": multiply,
+    "subtract": subtract,
+    "divide": divide,
+    "power": power,
+    "absolute_value": absolute_value,
+    "concatenate": concatenate,
+    "to_uppercase": to_uppercase,
+    "to_lowercase": to_lowercase,
+    "string_length": string_length,
+    "list_sum": list_sum,
+    "list_average": list_average,
+}
@@ -0,0 +1,40 @@
+"""JSON encoding with orjson when available, stdlib json otherwise.
+
+``dumps`` mirrors the subset of ``json.dumps`` used in this project and
+returns a ``str``, so it can replace ``json.dumps`` call for call.
+"""
+
+from typing import Any, Optional
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def dumps(obj: Any, indent: Optional[int] = None, sort_keys: bool = False) -> str:
+    """Serialize obj to a JSON string.
+
+    Uses orjson for no indentation or an indent of 2 (the only indent
+    orjson supports), and stdlib json otherwise or if orjson is missing.
+
+    Args:
+        obj: Object to serialize
+        indent: Number of spaces to indent with (None for compact output)
+        sort_keys: If True, sort dictionary keys
+
+    Returns:
+        JSON string
+    """
+    if orjson is not None and indent in (None, 2):
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        try:
+            return orjson.dumps(obj, option=option).decode()
+        except TypeError:  # a type orjson can't encode: let json try (or raise)
+            pass
+    return json.dumps(obj, indent=indent, sort_keys=sort_keys)
@@ -0,0 +1,167 @@
+"""Cached (and, for plain functions, bypassed) signature introspection.
+
+Building a signature (via i2.Sig / inspect.signature) is one of the most
+expensive steps of registering a function or generating its schema, and the
+same callables are introspected over and over. Signatures are cached per
+function object, weakly, so the cache never keeps a function alive.
+"""
+
+from typing import Any, Callable, NamedTuple, Tuple
+from weakref import WeakKeyDictionary
+import inspect
+import types
+
+try:
+    from i2 import Sig
+except ImportError:
+    raise ImportError("i2 is required. Install with: pip install i2")
+
+
+_SIGNATURE_CACHE: "WeakKeyDictionary[Callable, inspect.Signature]" = WeakKeyDictionary()
+# Signatures set by attach_signature, which get_params can keep bypassing
+_ATTACHED_SIGNATURES: "WeakKeyDictionary[Callable, inspect.Signature]" = (
+    WeakKeyDictionary()
+)
+
+
+def _compute_signature(func: Callable) -> inspect.Signature:
+    """Compute the signature of func, using an attached ``__signature__`` as is."""
+    sig = getattr(func, "__signature__", None)
+    if isinstance(sig, inspect.Signature):
+        return sig
+    return Sig(func)
+
+
+def get_signature(func: Callable) -> inspect.Signature:
+    """Get the (cached) signature of a callable.
+
+    Callables that can't be weakly referenced or hashed (e.g. some builtins)
+    are introspected on every call.
+
+    Args:
+        func: The callable
+
+    Returns:
+        Signature of func
+    """
+    try:
+        return _SIGNATURE_CACHE[func]
+    except KeyError:
+        sig = _SIGNATURE_CACHE[func] = _compute_signature(func)
+        return sig
+    except TypeError:
+        return _compute_signature(func)
+
+
+def attach_signature(func: Callable) -> None:
+    """Set ``func.__signature__`` to its (cached) signature.
+
+    ``inspect.signature`` (and so i2, meshed, FastAPI...) returns an attached
+    ``__signature__`` as is, instead of rebuilding it on every call. Only
+    plain functions get one: on a class (or any other object) the attribute
+    would be inherited by subclasses and instances, and misreport their
+    signatures. Functions that already have one are left alone.
+
+    Args:
+        func: The callable
+    """
+    if not isinstance(func, types.FunctionType) or hasattr(func, "__signature__"):
+        return
+    try:
+        sig = get_signature(func)
+    except (TypeError, ValueError):  # no signature to be had
+        return
+    func.__signature__ = _ATTACHED_SIGNATURES[func] = sig
+
+
+_empty = inspect.Parameter.empty
+_POSITIONAL_ONLY = inspect.Parameter.POSITIONAL_ONLY
+_POSITIONAL_OR_KEYWORD = inspect.Parameter.POSITIONAL_OR_KEYWORD
+_VAR_POSITIONAL = inspect.Parameter.VAR_POSITIONAL
+_KEYWORD_ONLY = inspect.Parameter.KEYWORD_ONLY
+_VAR_KEYWORD = inspect.Parameter.VAR_KEYWORD
+
+
+class ParamSpec(NamedTuple):
+    """Lightweight stand-in for ``inspect.Parameter`` (same attribute names)."""
+
+    name: str
+    kind: Any
+    default: Any = _empty
+    annotation: Any = _empty
+
+
+def _fast_params(func: Callable) -> Tuple[Tuple[ParamSpec, ...], Any]:
+    """Read parameters straight off a plain function's code object.
+
+    Args:
+        func: A plain Python function (no ``__wrapped__``/``__signature__``)
+
+    Returns:
+        Tuple of (parameters, return_annotation)
+    """
+    co = func.__code__
+    names = co.co_varnames
+    n_pos = co.co_argcount
+    n_posonly = co.co_posonlyargcount
+    n_kwonly = co.co_kwonlyargcount
+    defaults = func.__defaults__ or ()
+    kwdefaults = func.__kwdefaults__ or {}
+    ann = func.__annotations__
+    first_default = n_pos - len(defaults)
+
+    params = []
+    for i, name in enumerate(names[:n_pos]):
+        params.append(
+            ParamSpec(
+                name,
+                _POSITIONAL_ONLY if i < n_posonly else _POSITIONAL_OR_KEYWORD,
+                defaults[i - first_default] if i >= first_default else _empty,
+                ann.get(name, _empty),
+            )
+        )
+    i = n_pos + n_kwonly
+    if co.co_flags & inspect.CO_VARARGS:
+        name = names[i]
+        params.append(ParamSpec(name, _VAR_POSITIONAL, _empty, ann.get(name, _empty)))
+        i += 1
+    for name in names[n_pos : n_pos + n_kwonly]:
+        params.append(
+            ParamSpec(
+                name,
+                _KEYWORD_ONLY,
+                kwdefaults.get(name, _empty),
+                ann.get(name, _empty),
+            )
+        )
+    if co.co_flags & inspect.CO_VARKEYWORDS:
+        name = names[i]
+        params.append(ParamSpec(name, _VAR_KEYWORD, _empty, ann.get(name, _empty)))
+
+    return tuple(params), ann.get("return", _empty)
+
+
+def get_params(func: Callable) -> Tuple[Tuple[Any, ...], Any]:
+    """Get the parameters and return annotation of a callable.
+
+    Plain functions are read directly from ``__code__``, ``__defaults__``,
+    ``__kwdefaults__`` and ``__annotations__``, without building a signature
+    (including those given their own signature by attach_signature).
+    Anything else (partials, builtins, callable instances, decorated
+    functions, functions with a custom ``__signature__``) goes through the
+    cached ``get_signature``.
+
+    Args:
+        func: The callable
+
+    Returns:
+        Tuple of (parameters, return_annotation). Parameters expose ``name``,
+        ``kind``, ``default`` and ``annotation`` like ``inspect.Parameter``,
+        with ``inspect.Parameter.empty`` for missing defaults/annotations.
+    """
+    if inspect.isfunction(func) and not hasattr(func, "__wrapped__"):
+        sig = getattr(func, "__signature__", None)
+        if sig is None or sig is _ATTACHED_SIGNATURES.get(func):
+            return _fast_params(func)
+    sig = get_signature(func)
+    return tuple(sig.parameters.values()), sig.return_annotation
@@ -4,11 +4,14 @@ This example shows how the unified root store provides a flat,
 key-value interface to different types of data storage.
 """
 
-import json
+import io
+import sys
+from contextlib import redirect_stdout
 import tempfile
 from pathlib import Path
 
 from app_meshed.stores.root_store import create_default_root_store
+from app_meshed.utils.fastjson import dumps
 
 
 def main():
@@ -55,11 +58,11 @@ def main():
         # Retrieve it
         retrieved = root.meshes["my_first_dag"]
         print("Retrieved DAG:")
-        print(json.dumps(retrieved, indent=2))
+        print(dumps(retrieved, indent=2))
         print()
 
         # List all meshes
-        print(f"All meshes in store: {list(root.meshes.keys())}")
+        print(f"All meshes in store: {list(root.meshes)}")
         print()
 
         # Example 2: Application configurations
@@ -84,7 +87,7 @@ def main():
         # Retrieve and display
         settings = root.configs["app_settings"]
         print("Retrieved settings:")
-        print(json.dumps(settings, indent=2))
+        print(dumps(settings, indent=2))
         print()
 
         # Example 3: Working with multiple items
@@ -122,13 +125,14 @@ def main():
             },
         }
 
-        for name, config in dags.items():
-            root.meshes[name] = config
+        root.meshes.update(dags)
+        for name in dags:
             print(f"✓ Stored DAG: '{name}'")
 
         print()
-        print(f"Total DAGs in store: {len(list(root.meshes.keys()))}")
-        print(f"DAG names: {list(root.meshes.keys())}")
+        mesh_keys = list(root.meshes)
+        print(f"Total DAGs in store: {len(mesh_keys)}")
+        print(f"DAG names: {mesh_keys}")
         print()
 
         # Example 4: Store statistics
@@ -159,7 +163,7 @@ def main():
         print("  dag = root.meshes['my_dag']           # Retrieve DAG")
         print("  'my_dag' in root.meshes               # Check existence")
         print("  del root.meshes['my_dag']             # Delete DAG")
-        print("  list(root.meshes.keys())              # List all keys")
+        print("  list(root.meshes)                     # List all keys")
         print()
 
         # Demonstrate the interface
@@ -185,7 +189,7 @@ def main():
         print("  ↓")
         print("  GET /store/meshes/my_dag")
         print()
-        print("  list(root.meshes.keys())")
+        print("  list(root.meshes)")
         print("  ↓")
         print("  GET /store/meshes/keys")
         print()
@@ -208,4 +212,10 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    # Collect the output and write it once, rather than once per print
+    out = io.StringIO()
+    try:
+        with redirect_stdout(out):
+            main()
+    finally:
+        sys.stdout.write(out.getvalue())
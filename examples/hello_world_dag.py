@@ -10,6 +10,7 @@ This demonstrates the basic workflow:
 from app_meshed.services.function_registry import FunctionRegistry
 from app_meshed.services.dag_service import DAGService
 from app_meshed.services.schema_service import func_to_schema
+from app_meshed.utils.fastjson import dumps
 
 
 def main():
@@ -50,8 +51,7 @@ def main():
     # Step 4: Generate JSON Schema for the function
     schema = func_to_schema(add)
     print("Step 4: Generated JSON Schema (for RJSF forms)")
-    import json
-    print(json.dumps(schema, indent=2))
+    print(dumps(schema, indent=2))
     print()
 
     # Step 5: Create a simple DAG configuration
@@ -69,7 +69,7 @@ def main():
     }
 
     print("Step 5: DAG Configuration")
-    print(json.dumps(dag_config, indent=2))
+    print(dumps(dag_config, indent=2))
     print()
 
     # Step 6: Execute the DAG
@@ -118,7 +118,7 @@ def main():
     }
 
     print("Chained DAG: (a + b) * c")
-    print(f"Configuration: {json.dumps(chained_config, indent=2)}")
+    print(f"Configuration: {dumps(chained_config, indent=2)}")
     print()
 
     chained_inputs = {
@@ -4,8 +4,8 @@ This example shows how function signatures are automatically converted
 to JSON Schemas suitable for React JSON Schema Form (RJSF).
 """
 
-import json
 from app_meshed.services.schema_service import func_to_schema, object_to_schema
+from app_meshed.utils.fastjson import dumps
 
 
 def process_audio(
@@ -52,7 +52,7 @@ def main():
     print()
 
     print("Generated JSON Schema (for RJSF):")
-    print(json.dumps(schema, indent=2))
+    print(dumps(schema, indent=2))
     print()
 
     # Example 2: Schema from a configuration object
@@ -74,11 +74,11 @@ def main():
     object_schema = object_to_schema(config, title="Server Configuration")
 
     print("Configuration object:")
-    print(json.dumps(config, indent=2))
+    print(dumps(config, indent=2))
     print()
 
     print("Generated JSON Schema:")
-    print(json.dumps(object_schema, indent=2))
+    print(dumps(object_schema, indent=2))
     print()
 
     # Example 3: Different parameter types
@@ -102,7 +102,7 @@ def main():
     complex_schema = func_to_schema(complex_function, title="Complex Parameters")
 
     print("Function with various types:")
-    print(json.dumps(complex_schema, indent=2))
+    print(dumps(complex_schema, indent=2))
     print()
 
     # Example 4: How this is used in the API
@@ -126,7 +126,7 @@ def main():
         "method": "GET",
         "response": schema,
     }
-    print(json.dumps(api_response, indent=2))
+    print(dumps(api_response, indent=2))
     print()
 
     print("=" * 70)
@@ -5,9 +5,19 @@ This example shows how to work with time-series data using
 """
 
 import numpy as np
+import io
+import sys
+from contextlib import redirect_stdout
 import tempfile
+from functools import lru_cache
 from pathlib import Path
 
+try:
+    import numexpr
+except ImportError:
+    # Optional: multi-threaded evaluation of the chirp expression
+    numexpr = None
+
 from app_meshed.services.stream_service import (
     FileStreamSource,
     StreamRegistry,
@@ -15,6 +25,14 @@ from app_meshed.services.stream_service import (
 )
 
 
+@lru_cache(maxsize=8)
+def _time_vector(sample_rate: float, duration: float) -> np.ndarray:
+    """Sample times for a signal, shared (read-only) by same-shaped signals."""
+    t = np.linspace(0, duration, int(sample_rate * duration), dtype=np.float32)
+    t.flags.writeable = False
+    return t
+
+
 def create_sample_data(file_path: Path, sample_rate: float, duration: float, signal_type: str = "sine"):
     """Create sample time-series data.
 
@@ -25,21 +43,47 @@ def create_sample_data(file_path: Path, sample_rate: float, duration: float, sig
         signal_type: Type of signal to generate
     """
     num_samples = int(sample_rate * duration)
-    t = np.linspace(0, duration, num_samples)
+    # float32 throughout (half the memory traffic of float64); phases are
+    # computed in place to avoid temporaries
+    t = _time_vector(sample_rate, duration)
+    rng = np.random.default_rng()
 
     if signal_type == "sine":
         # 440 Hz sine wave (musical note A4)
-        data = np.sin(2 * np.pi * 440 * t)
+        phase = np.multiply(t, np.float32(2 * np.pi * 440))
+        data = np.sin(phase, out=phase)
     elif signal_type == "chirp":
         # Chirp signal (frequency increases over time)
         f0, f1 = 100, 1000  # Start and end frequencies
-        data = np.sin(2 * np.pi * (f0 + (f1 - f0) * t / duration) * t)
+        if numexpr is not None:
+            data = numexpr.evaluate(
+                "sin(2 * pi * (f0 + (f1 - f0) * t / duration) * t)",
+                local_dict={
+                    "pi": np.float32(np.pi),
+                    "f0": np.float32(f0),
+                    "f1": np.float32(f1),
+                    "duration": np.float32(duration),
+                    "t": t,
+                },
+            )
+        else:
+            phase = np.multiply(t, np.float32((f1 - f0) / duration))
+            phase += np.float32(f0)
+            phase *= t
+            phase *= np.float32(2 * np.pi)
+            data = np.sin(phase, out=phase)
     elif signal_type == "noise":
         # Random noise
-        data = np.random.randn(num_samples) * 0.1
+        data = rng.standard_normal(num_samples, dtype=np.float32)
+        data *= np.float32(0.1)
     else:
         # Accelerometer-like data
-        data = np.random.randn(num_samples) * 0.5 + np.sin(2 * np.pi * 2 * t) * 0.3
+        data = rng.standard_normal(num_samples, dtype=np.float32)
+        data *= np.float32(0.5)
+        wave = np.multiply(t, np.float32(2 * np.pi * 2))
+        np.sin(wave, out=wave)
+        wave *= np.float32(0.3)
+        data += wave
 
     np.save(file_path, data)
     return data
@@ -73,11 +117,13 @@ def main():
 
         create_sample_data(audio_path, sample_rate, duration, "sine")
 
-        # Create stream source
+        # Create stream source (the .npy file is memory-mapped, so each
+        # [bt:tt] slice only reads the bytes it covers)
         audio_stream = FileStreamSource(
             source_id="audio_sample",
             file_path=audio_path,
             sample_rate=sample_rate,
+            mmap=True,
         )
 
         # Slice using [bt:tt] notation
@@ -255,4 +301,10 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    # Collect the output and write it once, rather than once per print
+    out = io.StringIO()
+    try:
+        with redirect_stdout(out):
+            main()
+    finally:
+        sys.stdout.write(out.getvalue())
@@ -0,0 +1,204 @@
+"""Tests for the HTTP API."""
+
+import os
+import tempfile
+
+os.environ.setdefault("APP_MESHED_DATA_PATH", tempfile.mkdtemp())
+
+import numpy as np
+import pytest
+from fastapi.testclient import TestClient
+
+from app_meshed.api.main import app, stream_registry
+from app_meshed.services.stream_service import StreamSource
+
+
+class ArraySource(StreamSource):
+    """In-memory stream source."""
+
+    def __init__(self, source_id, data, sample_rate=10.0):
+        super().__init__(source_id, sample_rate)
+        self.data = data
+
+    def __getitem__(self, key):
+        bt = int((key.start or 0) * self.sample_rate)
+        tt = int(key.stop * self.sample_rate) if key.stop is not None else None
+        return self.data[bt:tt]
+
+
+class BrokenSource(StreamSource):
+    """Stream source whose reads fail."""
+
+    def __getitem__(self, key):
+        raise OSError("disk read failed")
+
+
+@pytest.fixture(scope="module")
+def client():
+    """Test client with a few in-memory streams registered."""
+    stream_registry.register(ArraySource("ramp", np.arange(20, dtype=np.float32)))
+    stream_registry.register(ArraySource("neg", -np.arange(20, dtype=np.float32)))
+    stream_registry.register(ArraySource("complex", np.ones(20, dtype=np.complex64)))
+    stream_registry.register(BrokenSource("broken", 10.0))
+    with TestClient(app) as client:
+        yield client
+
+
+def _multi_slice(client, channel_ids, **kwargs):
+    return client.post(
+        "/streams/multi-channel/slice",
+        json={"channel_ids": channel_ids, "bt": 0.0, "tt": 0.5, **kwargs},
+    )
+
+
+def test_multi_channel_slice_streamed(client):
+    """Test the streamed multi-channel JSON document."""
+    response = _multi_slice(client, ["ramp", "unknown"])
+
+    assert response.status_code == 200
+    result = response.json()
+    assert (result["bt"], result["tt"]) == (0.0, 0.5)
+    assert list(result["channels"]) == ["ramp", "unknown"]
+    assert result["channels"]["ramp"]["data"] == [0.0, 1.0, 2.0, 3.0, 4.0]
+    assert result["channels"]["ramp"]["sample_rate"] == 10.0
+    assert "error" in result["channels"]["unknown"]
+
+
+def test_multi_channel_slice_streamed_errors(client):
+    """Test that failing channels become error entries in valid JSON."""
+    response = _multi_slice(client, ["broken", "complex", "ramp"])
+
+    assert response.status_code == 200
+    channels = response.json()["channels"]
+    assert channels["broken"] == {"error": "disk read failed"}
+    assert "error" in channels["complex"]
+    assert len(channels["ramp"]["data"]) == 5
+
+
+def test_raw_data_item_path(client):
+    """Test that raw_data items report their path relative to the data path."""
+    from pathlib import Path
+
+    from app_meshed.api.main import DATA_PATH, _RAW_DATA_DIR
+
+    with open(os.path.join(_RAW_DATA_DIR, "item.bin"), "wb") as f:
+        f.write(b"1234")
+
+    response = client.get("/store/raw_data/item.bin")
+    assert response.status_code == 200
+    item = response.json()
+    assert item["size"] == 4
+    assert item["path"] == str(Path(DATA_PATH) / "raw_data" / "item.bin")
+
+
+def test_numpy_orjson_response():
+    """Test that numpy arrays and scalars are encoded natively."""
+    from app_meshed.api.responses import NumpyORJSONResponse
+
+    response = NumpyORJSONResponse({"data": np.arange(3.0), "n": np.int64(3)})
+    assert response.body == b'{"data":[0.0,1.0,2.0],"n":3}'
+
+
+def test_slice_json_and_b64(client):
+    """Test the JSON sample formats of a single-stream slice."""
+    import base64
+
+    response = client.get("/streams/ramp/slice", params={"bt": 0, "tt": 0.3})
+    assert response.headers["content-type"] == "application/json"
+    assert response.json()["data"] == [0.0, 1.0, 2.0]
+
+    params = {"bt": 0, "tt": 0.3, "format": "b64"}
+    result = client.get("/streams/ramp/slice", params=params).json()
+    samples = np.frombuffer(base64.b64decode(result["data"]), dtype="<f4")
+    assert samples.tolist() == [0.0, 1.0, 2.0]
+    assert result["dtype"] == "float32"
+
+
+def test_slice_binary(client):
+    """Test that Accept: application/octet-stream gets raw float32 samples."""
+    response = client.get(
+        "/streams/ramp/slice",
+        params={"bt": 0, "tt": 0.3},
+        headers={"Accept": "application/json, application/octet-stream"},
+    )
+
+    assert response.headers["content-type"] == "application/octet-stream"
+    assert response.headers["X-Sample-Rate"] == "10.0"
+    assert response.headers["X-Shape"] == "3"
+    assert response.headers["X-Source-Id"] == "ramp"
+    assert np.frombuffer(response.content, dtype="<f4").tolist() == [0.0, 1.0, 2.0]
+
+
+def test_multi_channel_slice_binary(client):
+    """Test the binary multi-channel layout and its headers."""
+    response = client.post(
+        "/streams/multi-channel/slice",
+        json={"channel_ids": ["ramp", "neg"], "bt": 0.1, "tt": 0.3},
+        headers={"Accept": "application/octet-stream"},
+    )
+
+    assert response.headers["content-type"] == "application/octet-stream"
+    assert response.headers["X-Channel-Ids"] == "ramp,neg"
+    assert response.headers["X-Channel-Lengths"] == "2,2"
+    assert response.headers["X-Sample-Rates"] == "10.0,10.0"
+    samples = np.frombuffer(response.content, dtype="<f4")
+    assert samples.tolist() == [1.0, 2.0, -1.0, -2.0]
+
+    response = client.post(
+        "/streams/multi-channel/slice",
+        json={"channel_ids": ["unknown"]},
+        headers={"Accept": "application/octet-stream"},
+    )
+    assert response.status_code == 404
+
+
+def test_multi_channel_slice_stacked(client):
+    """Test the stacked multi-channel layout."""
+    result = _multi_slice(client, ["ramp", "neg"], layout="stacked").json()
+
+    assert result["channels"] == ["ramp", "neg"]
+    assert result["stacked"] is True
+    assert result["data"] == [[0.0, 1.0, 2.0, 3.0, 4.0], [0.0, -1.0, -2.0, -3.0, -4.0]]
+
+
+@pytest.mark.parametrize(
+    "body",
+    [
+        b"{not json",
+        b'{"bt": 0}',  # missing channel_ids
+        b'{"channel_ids": "ramp"}',
+        b'{"channel_ids": ["ramp"], "format": "csv"}',
+        b'{"channel_ids": ["ramp"], "layout": "rows"}',
+    ],
+)
+def test_multi_channel_slice_malformed_body(client, body):
+    """Test that malformed or invalid slice requests are rejected with 422."""
+    response = client.post(
+        "/streams/multi-channel/slice",
+        content=body,
+        headers={"Content-Type": "application/json"},
+    )
+    assert response.status_code == 422
+
+
+def test_dag_execute(client):
+    """Test executing a DAG from a DagExecuteRequest body."""
+    body = {
+        "dag_config": {"name": "sum", "nodes": [{"id": "n", "function": "add"}]},
+        "inputs": {"a": 2, "b": 3},
+    }
+
+    result = client.post("/dag/execute", json=body).json()
+
+    assert result == {"status": "success", "result": 5, "dag_name": "sum"}
+
+
+@pytest.mark.parametrize(
+    "body", [b"[]", b'{"inputs": {}}', b'{"dag_config": [], "inputs": {}}']
+)
+def test_dag_execute_malformed_body(client, body):
+    """Test that invalid DagExecuteRequest bodies are rejected with 422."""
+    response = client.post(
+        "/dag/execute", content=body, headers={"Content-Type": "application/json"}
+    )
+    assert response.status_code == 422
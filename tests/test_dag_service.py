@@ -2,11 +2,10 @@
 
 import pytest
 from app_meshed.services.function_registry import FunctionRegistry
-from app_meshed.services.dag_service import DAGService
+from app_meshed.services.dag_service import DAGService, scope_node_params
 
 
-@pytest.fixture
-def registry_with_functions():
+def _make_registry():
     """Create a registry with test functions."""
     registry = FunctionRegistry()
 
@@ -26,7 +25,13 @@ def registry_with_functions():
     return registry
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
+def registry_with_functions():
+    """Registry with test functions, shared by the module's (read-only) tests."""
+    return _make_registry()
+
+
+@pytest.fixture(scope="module")
 def dag_service(registry_with_functions):
     """Create a DAG service with test functions."""
     return DAGService(registry_with_functions)
@@ -124,3 +129,131 @@ def test_execute_from_config_error_handling(dag_service):
     assert result["status"] == "error"
     assert "error" in result
     assert result["dag_name"] == "error_dag"
+
+
+def test_node_scoped_inputs(dag_service):
+    """Test that inputs keyed by node ID only feed that node."""
+    config = {
+        "name": "chained",
+        "nodes": [
+            {"id": "step1", "function": "add"},
+            {"id": "step2", "function": "multiply"},
+        ],
+        "edges": [{"source": "step1", "target": "step2", "targetInput": "a"}],
+    }
+
+    result = dag_service.execute_from_config(
+        config, {"a": 5, "b": 3, "step2": {"b": 2}}
+    )
+
+    assert result["status"] == "success"
+    assert result["result"] == 16
+
+
+_CHAINED_CONFIG = {
+    "name": "chained",
+    "nodes": [
+        {"id": "step1", "function": "add"},
+        {"id": "step2", "function": "multiply"},
+    ],
+    "edges": [{"source": "step1", "target": "step2", "targetInput": "a"}],
+}
+
+
+def test_same_named_params_are_shared(dag_service):
+    """Test that same-named params of different nodes share one input."""
+    result = dag_service.execute_from_config(_CHAINED_CONFIG, {"a": 2, "b": 3})
+
+    assert result["status"] == "success"
+    assert result["result"] == 15  # (2 + 3) * 3
+
+
+def test_config_params_feed_only_their_node(dag_service):
+    """Test that params listed in the config are scoped to their node."""
+    config = {**_CHAINED_CONFIG, "params": {"step2": {"b": 2}}}
+
+    assert dag_service.execute_from_config(config, {"a": 5, "b": 3})["result"] == 16
+    # Node-keyed inputs override the config's params
+    inputs = {"a": 5, "b": 3, "step2": {"b": 10}}
+    assert dag_service.execute_from_config(config, inputs)["result"] == 80
+
+
+def test_scope_node_params():
+    """Test that param values become inputs and only their names stay."""
+    config = {**_CHAINED_CONFIG, "params": {"step2": {"b": 2}}}
+
+    scoped, dag_inputs = scope_node_params(config, {"a": 5, "step1": {"b": 3}})
+
+    assert scoped["params"] == {"step2": {"b": None}, "step1": {"b": None}}
+    assert dag_inputs == {"a": 5, "step2__b": 2, "step1__b": 3}
+    assert config["params"] == {"step2": {"b": 2}}  # not mutated
+
+
+def test_dag_is_cached(dag_service):
+    """Test that identical configs reuse the built DAG."""
+    config = {
+        "name": "cached_add",
+        "nodes": [{"id": "add_node", "function": "add"}],
+        "edges": [],
+    }
+    dag_service.clear_cache()
+
+    assert dag_service.execute_from_config(config, {"a": 1, "b": 2})["result"] == 3
+    assert dag_service.execute_from_config(config, {"a": 3, "b": 4})["result"] == 7
+    assert len(dag_service._dag_cache) == 1
+    assert dag_service.json_to_dag(dict(config)) is dag_service.json_to_dag(config)
+
+    dag_service.clear_cache()
+    assert not dag_service._dag_cache
+
+
+def test_dag_cache_invalidated_on_register():
+    """Test that re-registering a function invalidates cached DAGs."""
+    registry = _make_registry()  # mutated below, so not the shared fixture
+    service = DAGService(registry, dag_cache_size=1)
+    config = {"name": "sub", "nodes": [{"id": "n", "function": "subtract"}]}
+
+    dag = service.json_to_dag(config)
+    registry.register("subtract", registry.get_function("subtract"), override=True)
+
+    assert service.json_to_dag(config) is not dag
+    assert len(service._dag_cache) == 1
+
+
+def test_fast_validate_valid(dag_service):
+    """Test fast validation of a well-formed configuration."""
+    config = {
+        "name": "chained",
+        "nodes": [
+            {"id": "step1", "function": "add"},
+            {"id": "step2", "function": "multiply"},
+        ],
+        "edges": [{"source": "step1", "target": "step2", "targetInput": "a"}],
+        "params": {"step2": {"b": 2}},
+    }
+
+    assert dag_service.fast_validate(config) == []
+
+
+def test_fast_validate_errors(dag_service):
+    """Test that fast validation reports shape and registry errors."""
+    assert dag_service.fast_validate({"nodes": []}) == [
+        "DAG must have at least one node"
+    ]
+
+    config = {
+        "nodes": [
+            {"id": "node1", "function": "nonexistent"},
+            {"id": "node1", "function": "add"},
+            {"function": "add"},
+        ],
+        "edges": [{"source": "node1", "target": "missing"}],
+        "params": {"ghost": {}},
+    }
+    errors = dag_service.fast_validate(config)
+
+    assert len(errors) == 5
+    assert any("not found in registry" in e for e in errors)
+    assert any("Duplicate node id" in e for e in errors)
+    assert any("'missing' is not a declared node" in e for e in errors)
+    assert any("undeclared node 'ghost'" in e for e in errors)
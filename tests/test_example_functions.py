@@ -0,0 +1,42 @@
+"""Tests for example functions."""
+
+import numpy as np
+import pytest
+from app_meshed.utils.example_functions import list_average, list_sum
+
+
+def test_list_sum():
+    """Test that list sums keep the builtin sum's types and results."""
+    assert list_sum([1, 2, 3]) == 6
+    assert type(list_sum([1, 2, 3])) is int
+    assert list_sum([0.1] * 10) == sum([0.1] * 10)
+    assert type(list_sum([1, 2.5])) is float
+    assert list_sum([10**30, 1]) == 10**30 + 1
+
+
+def test_list_sum_empty():
+    """Test that an empty list sums to 0."""
+    assert list_sum([]) == 0
+    assert type(list_sum([])) is int
+
+
+def test_list_sum_array():
+    """Test that numpy arrays are summed to a Python number."""
+    result = list_sum(np.array([1.5, 2.5]))
+    assert result == 4.0
+    assert type(result) is float
+
+
+def test_list_average():
+    """Test averaging lists and arrays."""
+    assert list_average([1, 2, 3, 4]) == 2.5
+    assert list_average([0.1] * 10) == sum([0.1] * 10) / 10
+    assert list_average(np.array([1, 2])) == 1.5
+
+
+def test_list_average_empty():
+    """Test that averaging an empty list raises ValueError."""
+    with pytest.raises(ValueError, match="empty list"):
+        list_average([])
+    with pytest.raises(ValueError, match="empty list"):
+        list_average(np.array([]))
@@ -30,6 +30,86 @@ def test_get_function():
     assert func(3.0, 4.0) == 12.0
 
 
+def test_invoke():
+    """Test calling a registered function by name."""
+    registry = FunctionRegistry()
+
+    def power(base: float, exp: int = 2) -> float:
+        return base**exp
+
+    registry.register("power", power)
+
+    assert registry.invoke("power", {"base": 3.0}) == 9.0
+    assert registry.invoke("power", {"base": 2.0, "exp": 3}) == 8.0
+    with pytest.raises(TypeError):
+        registry.invoke("power", {"base": 2.0, "typo": 3})
+    with pytest.raises(KeyError, match="not found in registry"):
+        registry.invoke("nonexistent", {})
+
+
+def test_signature_attached_on_register():
+    """Test that registering pins the signature on the function."""
+    import inspect
+
+    registry = FunctionRegistry()
+
+    def scale(x: float, factor: float = 2.0) -> float:
+        return x * factor
+
+    registry.register("scale", scale)
+    registry.register("len", len)
+
+    assert list(scale.__signature__.parameters) == ["x", "factor"]
+    assert inspect.signature(scale) is scale.__signature__
+
+
+def test_signature_not_attached_to_classes():
+    """Test that registering a class leaves subclasses' signatures alone."""
+    import inspect
+
+    class Foo:
+        def __init__(self, a, b=1):
+            pass
+
+    class Bar(Foo):
+        def __init__(self, c):
+            pass
+
+    registry = FunctionRegistry()
+    registry.register("Foo", Foo)
+    registry.register("Bar", Bar)
+
+    assert "__signature__" not in vars(Foo)
+    assert list(inspect.signature(Bar).parameters) == ["c"]
+    assert [p.name for p in registry.get_metadata("Bar").parameters] == ["c"]
+
+
+def test_registered_function_params_skip_signature(monkeypatch):
+    """Test that registered functions keep reading parameters off __code__."""
+    import inspect
+
+    from app_meshed.utils import signatures
+
+    def scale(x: float, factor: float = 2.0) -> float:
+        return x * factor
+
+    registry = FunctionRegistry()
+    registry.register("scale", scale)
+    assert isinstance(scale.__signature__, inspect.Signature)
+
+    def fail(func):
+        raise AssertionError("get_signature should not be called")
+
+    monkeypatch.setattr(signatures, "get_signature", fail)
+    params, return_annotation = signatures.get_params(scale)
+    assert isinstance(params[0], signatures.ParamSpec)
+    assert [(p.name, p.default) for p in params] == [
+        ("x", inspect.Parameter.empty),
+        ("factor", 2.0),
+    ]
+    assert return_annotation is float
+
+
 def test_get_metadata():
     """Test extracting function metadata."""
     registry = FunctionRegistry()
@@ -132,3 +212,101 @@ def test_get_all_metadata():
     assert "func2" in all_meta
     assert all_meta["func1"]["name"] == "func1"
     assert all_meta["func2"]["name"] == "func2"
+
+
+def test_version_bumped_on_mutation():
+    """Test that register/unregister bump the registry version."""
+    registry = FunctionRegistry()
+    v0 = registry.version
+
+    def func():
+        pass
+
+    registry.register("func", func)
+    v1 = registry.version
+    assert v1 > v0
+
+    registry.register("func", func, override=True)
+    v2 = registry.version
+    assert v2 > v1
+
+    registry.unregister("func")
+    assert registry.version > v2
+
+
+def test_get_listing_bytes():
+    """Test the cached JSON listing of functions."""
+    import json
+
+    registry = FunctionRegistry()
+
+    def func1(a: int) -> int:
+        return a
+
+    registry.register("func1", func1)
+    listing = registry.get_listing_bytes()
+    assert json.loads(listing)["functions"] == ["func1"]
+    assert registry.get_listing_bytes() is listing
+
+    registry.register("func2", func1)
+    assert json.loads(registry.get_listing_bytes())["functions"] == ["func1", "func2"]
+
+
+def test_same_function_under_several_names():
+    """Test that cached introspection keeps per-name metadata distinct."""
+    registry = FunctionRegistry()
+
+    def func(a: int, b: int = 2) -> int:
+        return a + b
+
+    registry.register("first", func)
+    registry.register("second", func)
+
+    first = registry.get_metadata("first")
+    second = registry.get_metadata("second")
+    assert (first.name, second.name) == ("first", "second")
+    assert first.parameters == second.parameters
+    assert [p.name for p in second.parameters] == ["a", "b"]
+
+
+def test_register_builtin():
+    """Test registering a callable that can't be weakly referenced."""
+    registry = FunctionRegistry()
+    registry.register("abs", abs)
+    assert [p.name for p in registry.get_metadata("abs").parameters] == ["x"]
+
+
+def test_parameter_kinds():
+    """Test parameter kinds and defaults of a function with every kind."""
+    registry = FunctionRegistry()
+
+    def func(a, /, b: int, c=3, *args, d, e: str = "x", **kwargs) -> int:
+        return 0
+
+    registry.register("func", func)
+    params = registry.get_metadata("func").parameters
+    assert [(p.name, p.kind) for p in params] == [
+        ("a", "POSITIONAL_ONLY"),
+        ("b", "POSITIONAL_OR_KEYWORD"),
+        ("c", "POSITIONAL_OR_KEYWORD"),
+        ("args", "VAR_POSITIONAL"),
+        ("d", "KEYWORD_ONLY"),
+        ("e", "KEYWORD_ONLY"),
+        ("kwargs", "VAR_KEYWORD"),
+    ]
+    assert [p.default for p in params if p.has_default] == [3, "x"]
+    assert params[1].annotation == "int"
+
+
+def test_array_default():
+    """Test a default whose == isn't a plain bool (e.g. a numpy array)."""
+    import numpy as np
+
+    registry = FunctionRegistry()
+
+    def func(x=np.zeros(3)):
+        return x
+
+    registry.register("func", func)
+    (param,) = registry.get_metadata("func").parameters
+    assert param.has_default
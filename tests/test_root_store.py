@@ -0,0 +1,102 @@
+"""Tests for the root store and its function codec."""
+
+import importlib.util
+import os
+from functools import partial
+
+import pytest
+from app_meshed.stores.root_store import (
+    _MARSHAL_TAG,
+    RootStore,
+    _deserialize_fn,
+    _serialize_fn,
+)
+from app_meshed.utils.example_functions import add, power
+
+
+def test_plain_function_round_trip():
+    """Test that plain functions are marshalled and rebuilt."""
+    data = _serialize_fn(power)
+    assert data[:1] == _MARSHAL_TAG
+    assert data[1:5] == importlib.util.MAGIC_NUMBER
+
+    func = _deserialize_fn(data)
+    assert func(3.0) == 9.0
+    assert func.__name__ == "power"
+    assert func.__annotations__ == power.__annotations__
+
+
+def test_partial_round_trip():
+    """Test that non-function callables are pickled instead of marshalled."""
+    data = _serialize_fn(partial(add, 1))
+    assert data[:1] != _MARSHAL_TAG
+    assert _deserialize_fn(data)(2) == 3
+
+
+def test_lambda_round_trip():
+    """Test serializing a lambda."""
+    func = _deserialize_fn(_serialize_fn(lambda x: x * 2))
+    assert func(21) == 42
+
+
+def test_mismatched_bytecode_magic():
+    """Test that functions saved by another Python version are imported."""
+    data = _serialize_fn(power)
+    other_version = data[:1] + b"\x00\x00\r\n" + data[5:]
+    assert _deserialize_fn(other_version) is power
+
+    ref = b"no_such_module:power"
+    unimportable = data[:1] + b"\x00\x00\r\n" + len(ref).to_bytes(2, "big") + ref
+    with pytest.raises(ValueError, match="another Python version"):
+        _deserialize_fn(unimportable)
+
+
+def _age(path):
+    """Set a directory's modification time far in the past."""
+    os.utime(path, ns=(10**18, 10**18))
+
+
+def test_keys_follow_external_changes(tmp_path):
+    """Test that cached keys are dropped when files are added or removed."""
+    store = RootStore(tmp_path)
+    raw_dir = tmp_path / "raw_data"
+    (raw_dir / "a.bin").write_bytes(b"a")
+    _age(raw_dir)
+    assert list(store.raw_data) == ["a.bin"]
+
+    (raw_dir / "b.bin").write_bytes(b"b")
+    assert sorted(store.raw_data) == ["a.bin", "b.bin"]
+    assert "b.bin" in store.raw_data
+
+    (raw_dir / "a.bin").unlink()
+    assert list(store.raw_data) == ["b.bin"]
+    assert len(store.raw_data) == 1
+
+
+def test_keys_are_cached(tmp_path):
+    """Test that keys are cached while the directory is unchanged."""
+    store = RootStore(tmp_path)
+    raw_dir = tmp_path / "raw_data"
+    _age(raw_dir)
+    assert list(store.raw_data) == []
+
+    (raw_dir / "a.bin").write_bytes(b"a")
+    _age(raw_dir)  # change behind the store's back, hiding the new mtime
+    assert list(store.raw_data) == []
+
+    store.invalidate()
+    assert list(store.raw_data) == ["a.bin"]
+
+
+def test_keys_shared_between_stores(tmp_path):
+    """Test that stores on the same directory see each other's writes."""
+    store, other = RootStore(tmp_path), RootStore(tmp_path)
+    _age(tmp_path / "meshes")
+    assert list(other.meshes) == []
+
+    store.meshes["mesh"] = {"nodes": []}
+    assert list(other.meshes) == ["mesh"]
+    assert other.meshes["mesh"] == {"nodes": []}
+
+    del other.meshes["mesh"]
+    assert list(store.meshes) == []
@@ -125,3 +125,59 @@ def test_python_type_to_json_type():
     assert generator.python_type_to_json_type(bool) == "boolean"
     assert generator.python_type_to_json_type(list) == "array"
     assert generator.python_type_to_json_type(dict) == "object"
+
+
+def test_python_type_to_json_type_generics():
+    """Test conversions of typing generics."""
+    from typing import Dict, List
+    from app_meshed.services.schema_service import SchemaGenerator
+
+    generator = SchemaGenerator()
+
+    assert generator.python_type_to_json_type(List[int]) == "array"
+    assert generator.python_type_to_json_type(Dict[str, int]) == "object"
+    assert generator.python_type_to_json_type(list[float]) == "array"
+
+
+def test_object_to_schema_ndarray():
+    """Test that numpy arrays are typed from their dtype."""
+    import numpy as np
+
+    schema = object_to_schema(np.zeros((3, 2), dtype=np.float32))
+
+    assert schema["type"] == "array"
+    assert schema["items"] == {"type": "array", "items": {"type": "number"}}
+
+
+def test_object_to_schema_sampled_list():
+    """Test item schemas inferred from a sample of a heterogeneous list."""
+    from app_meshed.services.schema_service import SchemaGenerator
+
+    schema = SchemaGenerator(list_sample_size=4).object_to_schema([1, "a", 2, "b"])
+
+    assert schema["items"] == {"anyOf": [{"type": "integer"}, {"type": "string"}]}
+
+
+def test_object_to_schema_self_reference():
+    """Test that self-referencing containers don't recurse forever."""
+    obj = {}
+    obj["self"] = obj
+
+    schema = object_to_schema(obj)
+
+    assert schema["properties"]["self"]["properties"] == {}
+
+
+def test_object_to_schema_deeply_nested():
+    """Test that nesting deeper than the recursion limit is supported."""
+    import sys
+
+    obj = leaf = {}
+    for _ in range(sys.getrecursionlimit() + 100):
+        leaf["child"] = leaf = {}
+
+    schema = object_to_schema(obj)
+
+    for _ in range(sys.getrecursionlimit() + 100):
+        schema = schema["properties"]["child"]
+    assert schema == {"type": "object", "title": "child", "properties": {}}
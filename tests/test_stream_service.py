@@ -0,0 +1,98 @@
+"""Tests for stream service."""
+
+import numpy as np
+import pytest
+from app_meshed.services.stream_service import FileStreamSource, StreamRegistry
+
+
+@pytest.fixture
+def npy_path(tmp_path):
+    """A 10-sample .npy file holding 0..9."""
+    path = tmp_path / "stream.npy"
+    np.save(path, np.arange(10, dtype=np.float32))
+    return path
+
+
+@pytest.fixture
+def source(npy_path):
+    """File stream source at 10 samples per second (1 second long)."""
+    return FileStreamSource("stream", npy_path, sample_rate=10.0)
+
+
+def test_header_shape_read_without_loading(source):
+    """Test that the length comes from the .npy header, without mapping the data."""
+    metadata = source.get_metadata()
+
+    assert metadata["length_samples"] == 10
+    assert metadata["length_seconds"] == 1.0
+    assert source._data is None
+
+
+def test_slice_is_memory_mapped_view(source):
+    """Test that slices are read-only views, and read(writable=True) copies."""
+    view = source[0.2:0.5]
+    assert view.tolist() == [2.0, 3.0, 4.0]
+    assert not view.flags.writeable
+
+    copy = source.read(0.2, 0.5, writable=True)
+    copy[0] = -1
+    assert source[0.2:0.5].tolist() == [2.0, 3.0, 4.0]
+
+
+def test_slice_without_mmap(npy_path):
+    """Test reading a .npy file into memory."""
+    source = FileStreamSource("stream", npy_path, sample_rate=10.0, mmap=False)
+    assert source[0.0:0.3].tolist() == [0.0, 1.0, 2.0]
+
+
+def test_slice_past_the_end(source):
+    """Test that slices are clamped to the end of the stream."""
+    assert source[0.7:5.0].tolist() == [7.0, 8.0, 9.0]
+    assert source[2.0:3.0].tolist() == []
+    assert source[0.8:].tolist() == [8.0, 9.0]
+
+
+def test_slice_negative_times(source):
+    """Test that negative times are clamped to the start (not wrapped)."""
+    assert source[-0.3:0.2].tolist() == [0.0, 1.0]
+    assert source[-0.3:0.9].tolist() == [float(i) for i in range(9)]
+    assert source[0.0:-0.2].tolist() == []
+
+
+def test_slice_reversed_range(source):
+    """Test that a range ending before it starts is empty."""
+    assert source[0.5:0.2].tolist() == []
+
+
+def test_channel_slices_edge_ranges(source):
+    """Test the batched slicer on out-of-range, negative and reversed ranges."""
+    registry = StreamRegistry()
+    registry.register(source)
+
+    def slice_(bt, tt):
+        arrays, rates, errors = registry._channel_slices(["stream", "nope"], bt, tt)
+        assert rates == {"stream": 10.0}
+        assert list(errors) == ["nope"]
+        return arrays["stream"].tolist()
+
+    assert slice_(0.7, 5.0) == [7.0, 8.0, 9.0]
+    assert slice_(-0.3, 0.2) == [0.0, 1.0]
+    assert slice_(0.0, -0.2) == []
+    assert slice_(0.5, 0.2) == []
+
+
+def test_slice_streams_stacked_and_ragged(tmp_path, source):
+    """Test that slice_streams stacks equal channels and concatenates others."""
+    np.save(tmp_path / "short.npy", np.arange(3, dtype=np.float32))
+    registry = StreamRegistry()
+    registry.register(source)
+    registry.register(FileStreamSource("short", tmp_path / "short.npy", 10.0))
+
+    stacked = registry.slice_streams(["stream", "short"], 0.0, 0.3)
+    assert stacked["stacked"] is True
+    assert stacked["shape"] == (2, 3)
+
+    ragged = registry.slice_streams(["stream", "short"], 0.0, 0.5)
+    assert ragged["stacked"] is False
+    assert ragged["lengths"] == [5, 3]
+    assert ragged["data"].tolist() == [0.0, 1.0, 2.0, 3.0, 4.0, 0.0, 1.0, 2.0]